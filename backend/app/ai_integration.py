@@ -1,18 +1,35 @@
-import requests
+import asyncio
+import httpx
+import orjson
 import os
-import yaml
+import re
+import sys
+import time
+import json
+import logging
+import hashlib
+import functools
+import itertools
+import string
+from datetime import datetime
 from fastapi import HTTPException
-from app.database import get_user_information
-import litellm
-from litellm import completion
-from typing import Optional, Dict, List, Literal
+from starlette.concurrency import run_in_threadpool
+from app.database import get_user_information, get_cached_llm_response, save_llm_response
+from typing import Any, Optional, Dict, List, Literal
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Load LLM config from YAML file
+@functools.lru_cache(maxsize=1)
 def load_llm_config():
+    # Imported here so the YAML parser is only loaded when the config is read
+    import yaml
+    
     config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "llm_config.yaml")
     try:
         with open(config_path, 'r') as file:
@@ -29,7 +46,10 @@ def load_llm_config():
             },
             "api": {
                 "ollama": {
-                    "url": "http://localhost:11434/api/generate"
+                    "url": "http://localhost:11434/api/generate",
+                    "chat_url": "http://localhost:11434/api/chat",
+                    "keep_alive": "30m",
+                    "num_ctx": 8192
                 }
             }
         }
@@ -40,9 +60,173 @@ LLM_CONFIG = load_llm_config()
 # Get API URL from config
 OLLAMA_API_URL = LLM_CONFIG["api"]["ollama"]["url"]
 
+# Base URL (scheme + host) of the Ollama server, used for the shared client
+_ollama_url_parts = urlsplit(OLLAMA_API_URL)
+OLLAMA_BASE_URL = f"{_ollama_url_parts.scheme}://{_ollama_url_parts.netloc}"
+
+# Chat endpoint used for generation, and how long Ollama keeps the model loaded
+OLLAMA_CHAT_URL = LLM_CONFIG["api"]["ollama"].get("chat_url", f"{OLLAMA_BASE_URL}/api/chat")
+OLLAMA_KEEP_ALIVE = LLM_CONFIG["api"]["ollama"].get("keep_alive", "30m")
+OLLAMA_NUM_CTX = LLM_CONFIG["api"]["ollama"].get("num_ctx", 8192)
+
 # Default models for each provider
 DEFAULT_MODELS = LLM_CONFIG["models"]
 
+# How long (in seconds) cached LLM responses are reused
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Prompt templates, compiled once at import time
+RESUME_PROMPT_TEMPLATE = string.Template("""
+    I need to fully customize my resume for this job description.
+    
+    Job Description:
+    ${job_description}
+    
+    I need you to help me create a completely tailored resume. 
+    Please provide comprehensive guidance on:
+    
+    1. A professional summary section that showcases my fit for this role
+    2. Key skills that should be prominently featured (based on the job description)
+    3. How to rewrite work experience bullet points to align with this job
+    4. Achievements to emphasize that demonstrate value for this specific position
+    5. Technical skills and qualifications to highlight
+    6. Any education or certifications that would be particularly relevant
+    
+    For each section, please provide detailed, specific content examples that I can directly 
+    use in my resume. Tailor everything specifically to match the keywords and requirements 
+    in this job description.
+    
+    Assume I have the necessary background for this role. The goal is to create a highly 
+    targeted resume that will get past ATS systems and impress hiring managers.
+    """)
+
+# Maximum number of job descriptions analyzed in one batched prompt
+RESUME_BATCH_SIZE = 5
+
+RESUME_BATCH_PROMPT_TEMPLATE = string.Template("""
+    I need to customize my resume for each of the job descriptions below.
+    
+    For each job description, provide specific, actionable resume tailoring suggestions:
+    a professional summary, key skills to feature, how to rewrite work experience bullet
+    points, achievements to emphasize, and relevant qualifications or certifications.
+    
+    Return ONLY a JSON array of strings with exactly ${count} elements, one per job
+    description and in the same order. Each string contains the full suggestions for
+    that job. DO NOT include any text outside the JSON array.
+    
+    ${jobs}
+    """)
+
+COVER_LETTER_PROMPT_TEMPLATE = string.Template("""
+    Write a professional cover letter for a ${position} position at ${company_name}.
+    
+    Today's date is: ${today_date}
+    
+    My contact information:
+    ${contact_info}
+    
+    Job Description:
+    ${job_description}
+    
+    My Resume:
+    ${resume_text}
+    
+    The cover letter should:
+    1. Be professionally formatted
+    2. Highlight relevant skills and experience from my resume that match the job requirements
+    3. Show enthusiasm for the role and company
+    4. Include a strong opening and closing
+    5. Be approximately 300-400 words
+    6. Only mention skills and experience that are actually in my resume
+    7. Specifically mention the company name (${company_name}) and position (${position})
+    8. Reference specific requirements or qualifications from the job description
+    9. Use ${today_date} as the date in the cover letter
+    10. Include my name (${applicant_name}) at the appropriate spots
+    11. Include my name, email, phone number, and address at the top of the cover letter.
+    12. Include a closing with my name.
+    
+    IMPORTANT: ONLY output the exact text of the cover letter itself, the contact info, and sign off. DO NOT include any explanations, notes, or other text outside the cover letter.
+    """)
+
+# Token budgets for the long inputs interpolated into the cover letter prompt
+JOB_DESCRIPTION_MAX_TOKENS = 1500
+RESUME_TEXT_MAX_TOKENS = 1500
+
+# Boilerplate sections of scraped job descriptions that add tokens but no signal. A match
+# runs from the phrase to the end of its paragraph (the next blank line or the end of the text)
+_BOILERPLATE = re.compile(r"(?:equal opportunity employer|benefits include)[\s\S]*?(?=\n[ \t]*\n|\Z)", re.I)
+
+# Ending characters of the sentence or line before a boilerplate phrase
+_SENTENCE_ENDS = ".!?\n"
+
+_WORD = re.compile(r"\S+")
+
+def _max_words(max_tokens):
+    """Whitespace heuristic: roughly 0.75 words per token"""
+    return int(max_tokens * 0.75)
+
+def _strip_boilerplate(text):
+    """
+    Remove job ad boilerplate sections, each from the start of the sentence where
+    its phrase appears to the end of that paragraph
+    
+    Args:
+        text: The job description
+        
+    Returns:
+        str: The job description without its boilerplate sections
+    """
+    pieces = []
+    position = 0
+    for match in _BOILERPLATE.finditer(text):
+        sentence_start = max(text.rfind(end, position, match.start()) for end in _SENTENCE_ENDS) + 1
+        pieces.append(text[position:max(sentence_start, position)])
+        position = match.end()
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+def _clip(text, max_tokens):
+    """
+    Truncate text to roughly max_tokens tokens
+    
+    The text is cut after its last kept word, so its line breaks are preserved.
+    Clipping uses a word count rather than a tokenizer, so it needs no extra dependency
+    and no tokenizer download on the first prompt.
+    
+    Args:
+        text: The text to truncate
+        max_tokens: Maximum number of tokens to keep
+        
+    Returns:
+        str: The truncated text
+    """
+    if not text:
+        return text
+    
+    max_words = _max_words(max_tokens)
+    if len(text.split()) <= max_words:
+        return text
+    if max_words <= 0:
+        return ""
+    last_word = next(itertools.islice(_WORD.finditer(text), max_words - 1, None))
+    return text[:last_word.end()]
+
+def _clip_job_description(text, max_tokens):
+    """
+    Truncate a job description to roughly max_tokens tokens, dropping its boilerplate
+    sections first, but only when it is over budget
+    
+    Args:
+        text: The job description
+        max_tokens: Maximum number of tokens to keep
+        
+    Returns:
+        str: The job description, unchanged if it already fits
+    """
+    if not text or len(text.split()) <= _max_words(max_tokens):
+        return text
+    return _clip(_strip_boilerplate(text), max_tokens)
+
 class LLMSettings:
     """Class to handle LLM provider settings and configuration"""
     
@@ -56,6 +240,9 @@ class LLMSettings:
             "openai": os.getenv("OPENAI_API_KEY", ""),
             "anthropic": os.getenv("ANTHROPIC_API_KEY", "")
         }
+        
+        # Settings payload built by get_settings, reset whenever settings change
+        self._settings_cache: Optional[Dict[str, Any]] = None
     
     def update_settings(self, 
                         provider: Optional[str] = None, 
@@ -65,6 +252,8 @@ class LLMSettings:
                         anthropic_model: Optional[str] = None,
                         ollama_model: Optional[str] = None):
         """Update LLM provider settings"""
+        self._settings_cache = None
+        
         if provider:
             self.provider = provider
         
@@ -92,10 +281,16 @@ class LLMSettings:
         return self.models.get(self.provider, DEFAULT_MODELS[self.provider])
     
     def get_settings(self):
-        """Get all LLM settings"""
+        """Get all LLM settings, built once and reused until update_settings runs"""
+        if self._settings_cache is None:
+            self._settings_cache = self._build_settings()
+        return self._settings_cache
+    
+    def _build_settings(self):
+        """Build the settings payload returned by get_settings"""
         return {
             "provider": self.provider,
-            "models": self.models,
+            "models": dict(self.models),
             "api_keys": {
                 # Send masked keys if they exist, otherwise indicate their presence with a boolean
                 "openai": {
@@ -112,21 +307,141 @@ class LLMSettings:
 # Initialize global settings
 llm_settings = LLMSettings()
 
-def check_ollama_availability():
+# Shared async HTTP client for Ollama, created in the FastAPI lifespan
+_http_client: Optional[httpx.AsyncClient] = None
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the shared Ollama HTTP client
+    
+    Returns:
+        httpx.AsyncClient: Client with a keep-alive connection pool
+    """
+    global _http_client
+    _http_client = httpx.AsyncClient(
+        base_url=OLLAMA_BASE_URL,
+        timeout=httpx.Timeout(600.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+    )
+    return _http_client
+
+async def close_http_client():
+    """Close the shared Ollama HTTP client and litellm's clients if they were created"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    
+    # Only close litellm's clients if litellm was actually used
+    litellm = sys.modules.get("litellm")
+    if litellm is not None and litellm.aclient_session is not None:
+        await litellm.aclient_session.aclose()
+        litellm.client_session.close()
+        litellm.aclient_session = None
+        litellm.client_session = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared Ollama HTTP client, creating it on first use"""
+    if _http_client is None:
+        return create_http_client()
+    return _http_client
+
+# Connection pool and timeouts for cloud provider calls made through litellm
+LITELLM_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+LITELLM_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+def get_litellm():
+    """
+    Import litellm on first use and give it pooled keep-alive HTTP clients
+    
+    litellm is imported lazily so Ollama-only setups never pay its import cost.
+    
+    Returns:
+        module: The configured litellm module
+    """
+    import litellm
+    
+    if litellm.aclient_session is None:
+        litellm.client_session = httpx.Client(limits=LITELLM_LIMITS, timeout=LITELLM_TIMEOUT)
+        litellm.aclient_session = httpx.AsyncClient(limits=LITELLM_LIMITS, timeout=LITELLM_TIMEOUT)
+    return litellm
+
+# How long (in seconds) a successful Ollama probe is trusted before re-checking
+OLLAMA_AVAILABILITY_TTL = 30
+
+class OllamaAvailabilityCache:
+    """Remembers the last successful Ollama probe for a short time"""
+    
+    def __init__(self, ttl: float = OLLAMA_AVAILABILITY_TTL):
+        self.ttl = ttl
+        self.last_ok_ts = None
+    
+    def is_fresh(self):
+        """Whether the last successful probe is still within the TTL"""
+        return self.last_ok_ts is not None and time.monotonic() - self.last_ok_ts < self.ttl
+    
+    def mark_ok(self):
+        """Record a successful probe or request"""
+        self.last_ok_ts = time.monotonic()
+    
+    def invalidate(self):
+        """Forget the last successful probe so the next call re-checks"""
+        self.last_ok_ts = None
+
+ollama_availability = OllamaAvailabilityCache()
+
+async def check_ollama_availability(use_cache: bool = False):
     """
     Check if Ollama API is available
     
+    Args:
+        use_cache: Return the cached result if Ollama answered within the TTL
+    
     Returns:
         tuple: (available (bool), error message (str or None))
     """
+    if use_cache and ollama_availability.is_fresh():
+        return True, None
+    
     try:
-        response = requests.get("http://localhost:11434/api/version")
+        response = await get_http_client().get("/api/version")
         response.raise_for_status()
+        ollama_availability.mark_ok()
         return True, None
     except Exception as e:
+        ollama_availability.invalidate()
         return False, str(e)
 
-def check_openai_availability():
+# Keep-alive for the startup warm-up request, long enough to cover the first user request
+OLLAMA_WARMUP_KEEP_ALIVE = "60m"
+
+async def warm_up_ollama():
+    """
+    Load the configured Ollama model into memory with a one-token generation
+    
+    Failures are logged and ignored so startup still succeeds when Ollama is down.
+    
+    Returns:
+        bool: True if the model was warmed up
+    """
+    payload = {
+        "model": llm_settings.models["ollama"],
+        "prompt": "ok",
+        "stream": False,
+        "keep_alive": OLLAMA_WARMUP_KEEP_ALIVE,
+        "options": {"num_predict": 1}
+    }
+    
+    try:
+        response = await get_http_client().post("/api/generate", json=payload)
+        response.raise_for_status()
+        ollama_availability.mark_ok()
+        return True
+    except Exception as e:
+        logger.warning("Ollama warm-up skipped: %s", e)
+        return False
+
+async def check_openai_availability():
     """
     Check if OpenAI API is available with the current API key
     
@@ -138,25 +453,21 @@ def check_openai_availability():
     if not api_key:
         return False, "OpenAI API key not configured"
     
+    litellm = get_litellm()
+    
     try:
-        # Set the API key for the check
-        os.environ["OPENAI_API_KEY"] = api_key
-        
         # Use litellm to test the connection with a minimal prompt
-        litellm.completion(
+        await litellm.acompletion(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": "test"}],
-            max_tokens=10
+            max_tokens=10,
+            api_key=api_key
         )
         return True, None
     except Exception as e:
         return False, str(e)
-    finally:
-        # Restore original environment variable if it was changed temporarily
-        if "OPENAI_API_KEY" in os.environ and os.environ["OPENAI_API_KEY"] != api_key:
-            os.environ["OPENAI_API_KEY"] = api_key
 
-def check_anthropic_availability():
+async def check_anthropic_availability():
     """
     Check if Anthropic API is available with the current API key
     
@@ -168,25 +479,21 @@ def check_anthropic_availability():
     if not api_key:
         return False, "Anthropic API key not configured"
     
+    litellm = get_litellm()
+    
     try:
-        # Set the API key for the check
-        os.environ["ANTHROPIC_API_KEY"] = api_key
-        
         # Use litellm to test the connection with a minimal prompt
-        litellm.completion(
+        await litellm.acompletion(
             model="anthropic/claude-3-5-haiku-latest",
             messages=[{"role": "user", "content": "test"}],
-            max_tokens=10
+            max_tokens=10,
+            api_key=api_key
         )
         return True, None
     except Exception as e:
         return False, str(e)
-    finally:
-        # Restore original environment variable if it was changed temporarily
-        if "ANTHROPIC_API_KEY" in os.environ and os.environ["ANTHROPIC_API_KEY"] != api_key:
-            os.environ["ANTHROPIC_API_KEY"] = api_key
 
-def check_provider_availability(provider: str = None):
+async def check_provider_availability(provider: str = None):
     """
     Check if the specified LLM provider is available
     
@@ -200,21 +507,36 @@ def check_provider_availability(provider: str = None):
         provider = llm_settings.provider
         
     if provider == "ollama":
-        return check_ollama_availability()
+        return await check_ollama_availability()
     elif provider == "openai":
-        return check_openai_availability()
+        return await check_openai_availability()
     elif provider == "anthropic":
-        return check_anthropic_availability()
+        return await check_anthropic_availability()
     else:
         return False, f"Unknown provider: {provider}"
 
-def generate_text_with_ollama(prompt, model=None):
+def _ollama_chat_payload(prompt, model, temperature, stream):
+    """Build the /api/chat request body for a single-prompt generation"""
+    # keep_alive keeps the model resident between successive generations
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "stream": stream,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
+        "options": {"num_ctx": OLLAMA_NUM_CTX}
+    }
+    if temperature is not None:
+        payload["options"]["temperature"] = temperature
+    return payload
+
+async def generate_text_with_ollama(prompt, model=None, temperature=None):
     """
     Generate text using Ollama API
     
     Args:
         prompt: The prompt to send to Ollama
         model: The model to use (default: current Ollama model in settings)
+        temperature: Sampling temperature (default: the model's own default)
         
     Returns:
         str: The generated text
@@ -222,44 +544,53 @@ def generate_text_with_ollama(prompt, model=None):
     if model is None:
         model = llm_settings.models["ollama"]
         
-    # Check if Ollama is available
-    available, error = check_ollama_availability()
+    # Check if Ollama is available (cached, the POST below surfaces failures itself)
+    available, error = await check_ollama_availability(use_cache=True)
     if not available:
         raise HTTPException(
             status_code=503, 
             detail=f"Ollama is not available. Please make sure Ollama is running. Details: {error}"
         )
     
+    payload = _ollama_chat_payload(prompt, model, temperature, stream=False)
+    
     try:
-        response = requests.post(
-            OLLAMA_API_URL,
-            json={
-                "model": model,
-                "prompt": prompt,
-                "stream": False
-            }
+        response = await get_http_client().post(OLLAMA_CHAT_URL, json=payload)
+    except httpx.ConnectError:
+        logger.exception("Could not connect to Ollama")
+        ollama_availability.invalidate()
+        raise HTTPException(
+            status_code=503,
+            detail="Connection refused. Please make sure Ollama is running."
+        )
+    except httpx.HTTPError as e:
+        logger.exception("Request to Ollama failed")
+        ollama_availability.invalidate()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error generating text with Ollama: {e}"
         )
+    
+    try:
         response.raise_for_status()
-        return response.json().get("response", "")
-    except Exception as e:
-        error_msg = str(e)
-        if "404" in error_msg:
+    except httpx.HTTPStatusError as e:
+        logger.exception("Ollama returned HTTP %s", e.response.status_code)
+        if e.response.status_code == 404:
             raise HTTPException(
                 status_code=503,
                 detail="The API endpoint was not found. Please check if Ollama is running correctly and the API URL is correct."
             )
-        elif "Connection refused" in error_msg:
-            raise HTTPException(
-                status_code=503,
-                detail="Connection refused. Please make sure Ollama is running."
-            )
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Error generating text with Ollama: {error_msg}"
-            )
+        if e.response.status_code >= 500:
+            ollama_availability.invalidate()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error generating text with Ollama: {e.response.text}"
+        )
+    
+    ollama_availability.mark_ok()
+    return orjson.loads(response.content).get("message", {}).get("content", "")
 
-def generate_text_with_litellm(prompt, provider=None, model=None):
+async def generate_text_with_litellm(prompt, provider=None, model=None, temperature=0.7):
     """
     Generate text using LiteLLM with specified provider
     
@@ -267,6 +598,7 @@ def generate_text_with_litellm(prompt, provider=None, model=None):
         prompt: The prompt to send to the LLM
         provider: The provider to use (default: current provider in settings)
         model: The model to use (default: current model for the provider in settings)
+        temperature: Sampling temperature
         
     Returns:
         str: The generated text
@@ -277,60 +609,158 @@ def generate_text_with_litellm(prompt, provider=None, model=None):
     if model is None:
         model = llm_settings.models[provider]
     
-    # Check if provider is available
-    available, error = check_provider_availability(provider)
-    if not available:
-        raise HTTPException(
-            status_code=503,
-            detail=f"{provider.capitalize()} is not available. Details: {error}"
-        )
+    # Check if provider is available (Ollama runs its own cached check)
+    if provider != "ollama":
+        available, error = await check_provider_availability(provider)
+        if not available:
+            raise HTTPException(
+                status_code=503,
+                detail=f"{provider.capitalize()} is not available. Details: {error}"
+            )
     
     try:
         # Use direct Ollama API for Ollama provider
         if provider == "ollama":
-            return generate_text_with_ollama(prompt, model)
+            return await generate_text_with_ollama(prompt, model, temperature)
+        
+        litellm = get_litellm()
             
-        # Use LiteLLM for cloud providers with API keys from settings or environment
+        # Use LiteLLM for cloud providers, passing the key from settings or environment explicitly
         if provider == "openai":
             api_key = llm_settings.api_keys["openai"] or os.getenv("OPENAI_API_KEY", "")
-            os.environ["OPENAI_API_KEY"] = api_key
             litellm_model = f"openai/{model}"
         elif provider == "anthropic":
             api_key = llm_settings.api_keys["anthropic"] or os.getenv("ANTHROPIC_API_KEY", "")
-            os.environ["ANTHROPIC_API_KEY"] = api_key
             litellm_model = f"anthropic/{model}"
         else:
             raise ValueError(f"Unsupported provider: {provider}")
         
         # Call LiteLLM completion
-        response = litellm.completion(
+        response = await litellm.acompletion(
             model=litellm_model,
             messages=[{"role": "user", "content": prompt}],
-            temperature=0.7
+            temperature=temperature,
+            api_key=api_key
         )
         
         # Extract response text
         return response.choices[0].message.content
+    except HTTPException:
+        # Already mapped to a status code (e.g. Ollama being unavailable)
+        raise
     except Exception as e:
+        logger.exception("Error generating text with %s", provider)
         error_msg = str(e)
         raise HTTPException(
             status_code=500,
             detail=f"Error generating text with {provider}: {error_msg}"
         )
 
-def generate_text(prompt):
+async def stream_text_with_ollama(prompt, model=None, temperature=None):
+    """
+    Stream generated text from Ollama as tokens arrive
+    
+    Callers should check availability before starting the stream, since errors
+    raised after the first chunk can no longer change the HTTP status.
+    
+    Args:
+        prompt: The prompt to send to Ollama
+        model: The model to use (default: current Ollama model in settings)
+        temperature: Sampling temperature (default: the model's own default)
+        
+    Yields:
+        str: Chunks of generated text
+    """
+    if model is None:
+        model = llm_settings.models["ollama"]
+    
+    payload = _ollama_chat_payload(prompt, model, temperature, stream=True)
+    
+    async with get_http_client().stream("POST", OLLAMA_CHAT_URL, json=payload) as response:
+        response.raise_for_status()
+        ollama_availability.mark_ok()
+        # Ollama sends one JSON object per line until "done" is true
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            chunk = orjson.loads(line)
+            content = chunk.get("message", {}).get("content", "")
+            if content:
+                yield content
+            if chunk.get("done"):
+                break
+
+async def stream_text(prompt, temperature=0.7):
+    """
+    Stream text from the currently configured LLM provider
+    
+    Ollama output is streamed token by token; cloud providers return the
+    full text as a single chunk.
+    
+    Args:
+        prompt: The prompt to send to the LLM
+        temperature: Sampling temperature
+        
+    Yields:
+        str: Chunks of generated text
+    """
+    if llm_settings.provider == "ollama":
+        async for chunk in stream_text_with_ollama(prompt, temperature=temperature):
+            yield chunk
+    else:
+        yield await generate_text(prompt, temperature=temperature)
+
+def _cache_key(provider, model, prompt, temperature):
+    """Build a deterministic cache key for an LLM request"""
+    payload = json.dumps(
+        {"provider": provider, "model": model, "prompt": prompt, "temperature": temperature},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+async def generate_text(prompt, temperature=0.7):
     """
     Generate text using the currently configured LLM provider
     
+    Responses for deterministic requests (temperature 0) are cached in the
+    database and reused for LLM_CACHE_TTL seconds.
+    
     Args:
         prompt: The prompt to send to the LLM
+        temperature: Sampling temperature (0 enables the response cache)
         
     Returns:
         str: The generated text
     """
-    return generate_text_with_litellm(prompt)
+    if temperature != 0:
+        return await generate_text_with_litellm(prompt, temperature=temperature)
+    
+    provider = llm_settings.provider
+    model = llm_settings.models[provider]
+    key = _cache_key(provider, model, prompt, temperature)
+    
+    cached = await run_in_threadpool(get_cached_llm_response, key, LLM_CACHE_TTL)
+    if cached is not None:
+        return cached
+    
+    response = await generate_text_with_litellm(prompt, provider, model, temperature)
+    await run_in_threadpool(save_llm_response, key, response)
+    return response
 
-def generate_resume_suggestions(job_description: str) -> str:
+async def generate_batch(prompts: List[str], temperature=0.7) -> List[str]:
+    """
+    Generate text for several independent prompts concurrently
+    
+    Args:
+        prompts: The prompts to send to the LLM
+        temperature: Sampling temperature used for every prompt
+        
+    Returns:
+        list: The generated texts, in the same order as the prompts
+    """
+    return list(await asyncio.gather(*(generate_text(prompt, temperature) for prompt in prompts)))
+
+async def generate_resume_suggestions(job_description: str) -> str:
     """
     Generate fully customized resume content based on a job description
     
@@ -340,33 +770,66 @@ def generate_resume_suggestions(job_description: str) -> str:
     Returns:
         str: Full resume customization suggestions
     """
-    prompt = f"""
-    I need to fully customize my resume for this job description.
+    prompt = RESUME_PROMPT_TEMPLATE.substitute(job_description=job_description)
     
-    Job Description:
-    {job_description}
+    return await generate_text(prompt, temperature=0)
+
+def _parse_batch_response(response: str, count: int) -> Optional[List[str]]:
+    """Parse a JSON array of `count` strings out of a batched LLM response"""
+    start = response.find("[")
+    end = response.rfind("]")
+    if start == -1 or end < start:
+        return None
     
-    I need you to help me create a completely tailored resume. 
-    Please provide comprehensive guidance on:
+    try:
+        items = json.loads(response[start:end + 1])
+    except ValueError:
+        return None
     
-    1. A professional summary section that showcases my fit for this role
-    2. Key skills that should be prominently featured (based on the job description)
-    3. How to rewrite work experience bullet points to align with this job
-    4. Achievements to emphasize that demonstrate value for this specific position
-    5. Technical skills and qualifications to highlight
-    6. Any education or certifications that would be particularly relevant
+    if not isinstance(items, list) or len(items) != count or not all(isinstance(item, str) for item in items):
+        return None
+    return items
+
+async def _generate_resume_suggestions_chunk(job_descriptions: List[str]) -> List[str]:
+    """Generate suggestions for up to RESUME_BATCH_SIZE job descriptions with one prompt"""
+    if len(job_descriptions) == 1:
+        return [await generate_resume_suggestions(job_descriptions[0])]
+    
+    jobs = "\n".join(
+        f"<<JOB {index}>>\n{job_description}"
+        for index, job_description in enumerate(job_descriptions, start=1)
+    )
+    prompt = RESUME_BATCH_PROMPT_TEMPLATE.substitute(count=len(job_descriptions), jobs=jobs)
+    
+    suggestions = _parse_batch_response(await generate_text(prompt, temperature=0), len(job_descriptions))
+    if suggestions is None:
+        # Fall back to one prompt per job description
+        suggestions = list(await asyncio.gather(
+            *(generate_resume_suggestions(job_description) for job_description in job_descriptions)
+        ))
+    return suggestions
+
+async def generate_resume_suggestions_batch(job_descriptions: List[str]) -> List[str]:
+    """
+    Generate resume customization suggestions for several job descriptions
     
-    For each section, please provide detailed, specific content examples that I can directly 
-    use in my resume. Tailor everything specifically to match the keywords and requirements 
-    in this job description.
+    Job descriptions are combined into prompts of up to RESUME_BATCH_SIZE
+    items, so N descriptions need far fewer LLM round-trips.
     
-    Assume I have the necessary background for this role. The goal is to create a highly 
-    targeted resume that will get past ATS systems and impress hiring managers.
+    Args:
+        job_descriptions: The job descriptions to analyze
+        
+    Returns:
+        list: Suggestions for each job description, in the same order
     """
-    
-    return generate_text(prompt)
+    chunks = [
+        job_descriptions[start:start + RESUME_BATCH_SIZE]
+        for start in range(0, len(job_descriptions), RESUME_BATCH_SIZE)
+    ]
+    results = await asyncio.gather(*(_generate_resume_suggestions_chunk(chunk) for chunk in chunks))
+    return [suggestion for chunk_result in results for suggestion in chunk_result]
 
-def generate_cover_letter(
+def build_cover_letter_prompt(
     job_description: str, 
     company_name: str, 
     position: str, 
@@ -374,10 +837,11 @@ def generate_cover_letter(
     applicant_name: str = '',
     applicant_email: str = '',
     applicant_phone: str = '',
-    applicant_address: str = ''
+    applicant_address: str = '',
+    use_profile: bool = True
 ) -> str:
     """
-    Generate a cover letter based on job description and resume
+    Build the cover letter prompt, filling missing applicant fields from the profile
     
     Args:
         job_description: The job description
@@ -388,15 +852,16 @@ def generate_cover_letter(
         applicant_email: Applicant's email (optional, will pull from profile if not provided)
         applicant_phone: Applicant's phone number (optional, will pull from profile if not provided)
         applicant_address: Applicant's address (optional, will pull from profile if not provided)
+        use_profile: Fill missing applicant fields from the saved profile
         
     Returns:
-        str: Generated cover letter text
+        str: The prompt to send to the LLM
     """
     # Get today's date formatted as Month Day, Year
-    today_date = __import__('datetime').datetime.now().strftime("%B %d, %Y")
+    today_date = datetime.now().strftime("%B %d, %Y")
     
-    # Get user information from profile if not provided
-    if not all([applicant_name, applicant_email, applicant_phone, applicant_address]):
+    # Get user information from profile if requested and not provided
+    if use_profile and not all([applicant_name, applicant_email, applicant_phone, applicant_address]):
         user_info = get_user_information()
         applicant_name = applicant_name or user_info.get('full_name', '')
         applicant_email = applicant_email or user_info.get('email', '')
@@ -414,35 +879,72 @@ def generate_cover_letter(
     if applicant_address:
         contact_info += f"Address: {applicant_address}\n"
     
-    prompt = f"""
-    Write a professional cover letter for a {position} position at {company_name}.
-    
-    Today's date is: {today_date}
-    
-    My contact information:
-    {contact_info}
+    # Keep the prompt short: drop job ad boilerplate and clip both long inputs
+    job_description = _clip_job_description(job_description or "", JOB_DESCRIPTION_MAX_TOKENS)
+    resume_text = _clip(resume_text, RESUME_TEXT_MAX_TOKENS)
+    
+    return COVER_LETTER_PROMPT_TEMPLATE.substitute(
+        position=position,
+        company_name=company_name,
+        today_date=today_date,
+        contact_info=contact_info,
+        job_description=job_description,
+        resume_text=resume_text,
+        applicant_name=applicant_name
+    )
+
+async def generate_cover_letter(
+    job_description: str, 
+    company_name: str, 
+    position: str, 
+    resume_text: str,
+    applicant_name: str = '',
+    applicant_email: str = '',
+    applicant_phone: str = '',
+    applicant_address: str = '',
+    use_profile: bool = True
+) -> str:
+    """
+    Generate a cover letter based on job description and resume
     
-    Job Description:
-    {job_description}
+    Args:
+        job_description: The job description
+        company_name: The company name
+        position: The position being applied for
+        resume_text: Text content of the resume
+        applicant_name: Applicant's full name (optional, will pull from profile if not provided)
+        applicant_email: Applicant's email (optional, will pull from profile if not provided)
+        applicant_phone: Applicant's phone number (optional, will pull from profile if not provided)
+        applicant_address: Applicant's address (optional, will pull from profile if not provided)
+        use_profile: Fill missing applicant fields from the saved profile
+        
+    Returns:
+        str: Generated cover letter text
+    """
+    prompt = build_cover_letter_prompt(
+        job_description, company_name, position, resume_text,
+        applicant_name, applicant_email, applicant_phone, applicant_address,
+        use_profile
+    )
     
-    My Resume:
-    {resume_text}
+    return await generate_text(prompt)
+
+async def stream_cover_letter(job_description: str, company_name: str, position: str, resume_text: str):
+    """
+    Stream a cover letter based on job description and resume
     
-    The cover letter should:
-    1. Be professionally formatted
-    2. Highlight relevant skills and experience from my resume that match the job requirements
-    3. Show enthusiasm for the role and company
-    4. Include a strong opening and closing
-    5. Be approximately 300-400 words
-    6. Only mention skills and experience that are actually in my resume
-    7. Specifically mention the company name ({company_name}) and position ({position})
-    8. Reference specific requirements or qualifications from the job description
-    9. Use {today_date} as the date in the cover letter
-    10. Include my name ({applicant_name}) at the appropriate spots
-    11. Include my name, email, phone number, and address at the top of the cover letter.
-    12. Include a closing with my name.
+    Applicant details are taken from the saved profile.
     
-    IMPORTANT: ONLY output the exact text of the cover letter itself, the contact info, and sign off. DO NOT include any explanations, notes, or other text outside the cover letter.
+    Args:
+        job_description: The job description
+        company_name: The company name
+        position: The position being applied for
+        resume_text: Text content of the resume
+        
+    Yields:
+        str: Chunks of the generated cover letter
     """
+    prompt = build_cover_letter_prompt(job_description, company_name, position, resume_text)
     
-    return generate_text(prompt)
+    async for chunk in stream_text(prompt):
+        yield chunk
@@ -1,6 +1,8 @@
 import os
 import sqlite3
 import datetime
+import threading
+import time
 from fastapi import HTTPException
 from contextlib import contextmanager
 
@@ -13,15 +15,107 @@ COVER_LETTER_FOLDER = "cover_letters"
 os.makedirs(RESUME_FOLDER, exist_ok=True)
 os.makedirs(COVER_LETTER_FOLDER, exist_ok=True)
 
+# One long-lived connection per thread (WAL lets readers run alongside a writer);
+# every connection is also registered so they can all be closed on shutdown
+_thread_local = threading.local()
+_connections = []
+_connections_lock = threading.Lock()
+
+def _open_connection():
+    """Open a database connection and apply connection pragmas"""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None, timeout=5.0)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """Context manager for the calling thread's database connection"""
+    conn = getattr(_thread_local, "connection", None)
+    if conn is None:
+        conn = _open_connection()
+        _thread_local.connection = conn
+        with _connections_lock:
+            _connections.append(conn)
+    yield conn
+
+def close_db_connection():
+    """Close every database connection opened so far"""
+    with _connections_lock:
+        for conn in _connections:
+            conn.close()
+        _connections.clear()
+    # Threads holding a closed connection reopen one on next use
+    global _thread_local
+    _thread_local = threading.local()
+
+# Bumped on every job application write so cached aggregates can be invalidated
+_job_applications_version = 0
+
+def _bump_job_applications_version():
+    """Mark cached job application aggregates as stale"""
+    global _job_applications_version
+    _job_applications_version += 1
+
+def get_job_applications_version():
+    """Get a counter that changes whenever job applications are written"""
+    return _job_applications_version
+
+# Whether the FTS5 search index is available (FTS5 or its trigram tokenizer may be missing)
+_search_index_enabled = False
+
+# Searches shorter than this can't use the trigram index and fall back to LIKE
+SEARCH_INDEX_MIN_LENGTH = 3
+
+def _setup_search_index(cursor):
+    """Create the trigram FTS5 index over company, position and job description, kept in sync by triggers"""
+    global _search_index_enabled
+    
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'job_applications_fts'")
+    exists = cursor.fetchone() is not None
+    
     try:
-        yield conn
-    finally:
-        conn.close()
+        cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS job_applications_fts USING fts5(
+            company_name, position, job_description,
+            content='job_applications', content_rowid='id', tokenize='trigram'
+        )
+        ''')
+    except sqlite3.OperationalError as e:
+        print(f"Full-text search index unavailable, using LIKE search: {e}")
+        _search_index_enabled = False
+        return
+    
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS job_applications_fts_insert AFTER INSERT ON job_applications BEGIN
+        INSERT INTO job_applications_fts(rowid, company_name, position, job_description)
+        VALUES (new.id, new.company_name, new.position, new.job_description);
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS job_applications_fts_delete AFTER DELETE ON job_applications BEGIN
+        INSERT INTO job_applications_fts(job_applications_fts, rowid, company_name, position, job_description)
+        VALUES ('delete', old.id, old.company_name, old.position, old.job_description);
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS job_applications_fts_update
+    AFTER UPDATE OF company_name, position, job_description ON job_applications BEGIN
+        INSERT INTO job_applications_fts(job_applications_fts, rowid, company_name, position, job_description)
+        VALUES ('delete', old.id, old.company_name, old.position, old.job_description);
+        INSERT INTO job_applications_fts(rowid, company_name, position, job_description)
+        VALUES (new.id, new.company_name, new.position, new.job_description);
+    END
+    ''')
+    
+    # Index rows that existed before the search index was added
+    if not exists:
+        cursor.execute("INSERT INTO job_applications_fts(job_applications_fts) VALUES ('rebuild')")
+    
+    _search_index_enabled = True
 
 def setup_database():
     """Set up the database tables if they don't exist"""
@@ -62,6 +156,21 @@ def setup_database():
         )
         ''')
         
+        # Indexes for the dashboard ordering and status filters
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_applications_date_applied ON job_applications(date_applied DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_applications_status ON job_applications(status)')
+        
+        _setup_search_index(cursor)
+        
+        # Create LLM response cache table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS llm_cache (
+            key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        ''')
+        
         # Check if uploaded_resume_path column exists and add it if not
         try:
             # This query will fail if the column doesn't exist
@@ -78,70 +187,246 @@ def setup_database():
         
         conn.commit()
 
+# Columns supplied by the caller when inserting a job application
+JOB_APPLICATION_INSERT_FIELDS = (
+    "company_name", "position", "date_applied", "job_description", "status",
+    "salary_info", "contact_info", "application_url", "notes",
+    "resume_path", "uploaded_resume_path", "cover_letter_path"
+)
+
+INSERT_JOB_APPLICATION_SQL = '''
+INSERT INTO job_applications (
+    company_name, position, date_applied, job_description, status,
+    salary_info, contact_info, application_url, notes,
+    resume_path, uploaded_resume_path, cover_letter_path, created_at, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 def add_job_application(company_name, position, date_applied, job_description, status, 
                        salary_info=None, contact_info=None, application_url=None, notes=None,
                        resume_path=None, cover_letter_path=None, uploaded_resume_path=None):
-    """Add a new job application to the database"""
+    """Add a new job application to the database and return the stored row as a dict"""
     with get_db_connection() as conn:
         cursor = conn.cursor()
         
         now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        cursor.execute('''
-        INSERT INTO job_applications (
-            company_name, position, date_applied, job_description, status,
-            salary_info, contact_info, application_url, notes,
-            resume_path, uploaded_resume_path, cover_letter_path, created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        # RETURNING hands back the new row, so callers don't need a follow-up SELECT
+        cursor.execute(INSERT_JOB_APPLICATION_SQL + ' RETURNING *', (
             company_name, position, date_applied, job_description, status,
             salary_info, contact_info, application_url, notes,
             resume_path, uploaded_resume_path, cover_letter_path, now, now
         ))
         
-        job_id = cursor.lastrowid
+        # fetchall() steps the statement to completion so the implicit transaction ends here
+        row = cursor.fetchall()[0]
         conn.commit()
+        _bump_job_applications_version()
+        
+        return dict(row)
+
+def add_job_applications_bulk(rows):
+    """
+    Add many job applications in a single transaction
+    
+    Args:
+        rows: List of dicts keyed by JOB_APPLICATION_INSERT_FIELDS (missing optional fields default to None)
+        
+    Returns:
+        int: Number of job applications inserted
+    """
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    values = [
+        tuple(row.get(field) for field in JOB_APPLICATION_INSERT_FIELDS) + (now, now)
+        for row in rows
+    ]
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
         
-        return job_id
+        cursor.execute('BEGIN')
+        try:
+            cursor.executemany(INSERT_JOB_APPLICATION_SQL, values)
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+        _bump_job_applications_version()
+        
+        return len(values)
+
+# Columns that update_job_application may set, mapped to their SET fragments
+UPDATABLE_JOB_APPLICATION_COLUMNS = {
+    column: f"{column} = ?"
+    for column in (
+        "company_name", "position", "date_applied", "job_description", "status",
+        "salary_info", "contact_info", "application_url", "notes",
+        "resume_path", "uploaded_resume_path", "cover_letter_path", "updated_at"
+    )
+}
 
 def update_job_application(job_id, **kwargs):
-    """Update an existing job application"""
+    """Update an existing job application (unknown columns are ignored) and return the updated row as a dict"""
     with get_db_connection() as conn:
         cursor = conn.cursor()
         
         # Add updated_at timestamp
         kwargs['updated_at'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        # Build the SET clause for the SQL query
-        set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
-        values = list(kwargs.values())
+        # Build the SET clause from the allow-listed columns only
+        columns = [column for column in kwargs if column in UPDATABLE_JOB_APPLICATION_COLUMNS]
+        set_clause = ", ".join(UPDATABLE_JOB_APPLICATION_COLUMNS[column] for column in columns)
+        values = [kwargs[column] for column in columns]
         values.append(job_id)  # For the WHERE clause
         
         cursor.execute(f'''
         UPDATE job_applications
         SET {set_clause}
         WHERE id = ?
+        RETURNING *
         ''', values)
+        rows = cursor.fetchall()
         
-        if cursor.rowcount == 0:
+        if not rows:
             raise HTTPException(status_code=404, detail=f"Job application with ID {job_id} not found")
         
         conn.commit()
-        return True
+        _bump_job_applications_version()
+        return dict(rows[0])
+
+def _job_application_filters(status=None, search=None):
+    """
+    Build the WHERE clause shared by the job application list and count queries
+    
+    Args:
+        status: Only match applications with this status
+        search: Case-insensitive substring matched against company name, position and job description
+        
+    Returns:
+        tuple: (where clause (str, empty when unfiltered), query parameters (list))
+    """
+    conditions = []
+    params = []
+    
+    if status:
+        conditions.append("status = ?")
+        params.append(status)
+    
+    if search and _search_index_enabled and len(search) >= SEARCH_INDEX_MIN_LENGTH:
+        # The trigram index matches case-insensitive substrings of a quoted phrase
+        conditions.append("id IN (SELECT rowid FROM job_applications_fts WHERE job_applications_fts MATCH ?)")
+        params.append('"' + search.replace('"', '""') + '"')
+    elif search:
+        # Escape LIKE wildcards so the search is a plain substring match
+        # (SQLite's LIKE is already case-insensitive for ASCII)
+        pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        conditions.append(
+            "(company_name LIKE ? ESCAPE '\\'"
+            " OR position LIKE ? ESCAPE '\\'"
+            " OR job_description LIKE ? ESCAPE '\\')"
+        )
+        params.extend([pattern, pattern, pattern])
+    
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, params
 
-def get_all_job_applications():
-    """Get all job applications"""
+# Columns returned for list views, which do not need descriptions, notes or file paths
+JOB_APPLICATION_SUMMARY_COLUMNS = ("id", "company_name", "position", "status", "date_applied")
+
+def get_all_job_applications(status=None, search=None, limit=None, offset=0, columns=None):
+    """
+    Get job applications, newest first, optionally filtered and paginated
+    
+    Args:
+        status: Only return applications with this status
+        search: Case-insensitive substring matched against company name, position and job description
+        limit: Maximum number of rows to return (default: all)
+        offset: Number of rows to skip
+        columns: Column names to select (default: all columns)
+        
+    Returns:
+        list: Job applications as dicts
+    """
+    where, params = _job_application_filters(status, search)
+    selected = ", ".join(columns) if columns else "*"
+    query = f'SELECT {selected} FROM job_applications {where} ORDER BY date_applied DESC'
+    
+    if limit is not None:
+        query += ' LIMIT ? OFFSET ?'
+        params.extend([limit, offset])
+    
     with get_db_connection() as conn:
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM job_applications ORDER BY date_applied DESC')
-        rows = cursor.fetchall()
+        cursor.execute(query, params)
+        # Rows are converted once here because the API response models need mappings
+        return [dict(row) for row in cursor.fetchall()]
+
+def get_job_applications_filtered(status=None, search=None, limit=100, offset=0, columns=None):
+    """
+    Get one page of job applications together with the total number of matches
+    
+    Args:
+        status: Only return applications with this status
+        search: Case-insensitive substring matched against company name, position and job description
+        limit: Maximum number of rows to return
+        offset: Number of rows to skip
+        columns: Column names to select (default: all columns)
+        
+    Returns:
+        tuple: (job applications as dicts (list), total matching rows (int))
+    """
+    rows = get_all_job_applications(status=status, search=search, limit=limit, offset=offset, columns=columns)
+    return rows, count_job_applications(status=status, search=search)
+
+def count_job_applications(status=None, search=None):
+    """Count job applications matching the same filters as get_all_job_applications"""
+    where, params = _job_application_filters(status, search)
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        
+        cursor.execute(f'SELECT COUNT(*) FROM job_applications {where}', params)
+        return cursor.fetchone()[0]
+
+def get_job_application_statistics(recent_limit=5):
+    """
+    Get aggregate statistics about job applications
+    
+    Args:
+        recent_limit: Number of most recent applications to include
+    
+    Returns:
+        dict: total_applications, status_counts, recent_applications and applications_by_month
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
         
-        applications = []
-        for row in rows:
-            applications.append(dict(row))
+        # status is NOT NULL, so the per-status counts add up to the total
+        cursor.execute('SELECT status, COUNT(*) FROM job_applications GROUP BY status')
+        status_counts = {status: count for status, count in cursor.fetchall()}
+        total = sum(status_counts.values())
         
-        return applications
+        # date_applied is stored as YYYY-MM-DD, so the first 7 characters are the month
+        cursor.execute('''
+        SELECT substr(date_applied, 1, 7) AS month, COUNT(*)
+        FROM job_applications
+        GROUP BY month
+        ''')
+        applications_by_month = {month: count for month, count in cursor.fetchall()}
+        
+        cursor.execute(
+            f'SELECT {", ".join(JOB_APPLICATION_SUMMARY_COLUMNS)} FROM job_applications ORDER BY date_applied DESC LIMIT ?',
+            (recent_limit,)
+        )
+        recent_applications = [dict(row) for row in cursor.fetchall()]
+    
+    return {
+        "total_applications": total,
+        "status_counts": status_counts,
+        "recent_applications": recent_applications,
+        "applications_by_month": applications_by_month
+    }
 
 def get_job_application(job_id):
     """Get a specific job application by ID"""
@@ -172,19 +457,33 @@ def delete_job_application(job_id):
         cursor.execute('DELETE FROM job_applications WHERE id = ?', (job_id,))
         
         conn.commit()
+        _bump_job_applications_version()
         
         # Delete associated files if they exist
         if row:
             resume_path, cover_letter_path = row
-            if resume_path and os.path.exists(resume_path):
-                os.remove(resume_path)
-            if cover_letter_path and os.path.exists(cover_letter_path):
-                os.remove(cover_letter_path)
+            for path in (resume_path, cover_letter_path):
+                if path:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
         
         return True
 
+# How long (in seconds) the user profile is served from memory before re-reading it
+USER_INFORMATION_TTL = 60
+
+# (loaded_at, version, user information dict) for the last profile read, or None
+_user_information_cache = None
+
+# Bumped after every profile write commits. A read that raced the write stores its row
+# under the version it started with, so that row is never served once it is stale
+_user_information_version = 0
+
 def save_user_information(full_name, address, phone, email):
     """Save or update user information"""
+    global _user_information_version
     with get_db_connection() as conn:
         cursor = conn.cursor()
         
@@ -210,10 +509,24 @@ def save_user_information(full_name, address, phone, email):
             ''', (full_name, address, phone, email, now, now))
         
         conn.commit()
+        _user_information_version += 1
         return True
 
 def get_user_information():
-    """Get user information"""
+    """Get user information (memoized for USER_INFORMATION_TTL seconds)"""
+    global _user_information_cache
+    version = _user_information_version
+    if _user_information_cache is not None:
+        loaded_at, cached_version, user_info = _user_information_cache
+        if cached_version == version and time.monotonic() - loaded_at < USER_INFORMATION_TTL:
+            return dict(user_info)
+    
+    user_info = _load_user_information()
+    _user_information_cache = (time.monotonic(), version, user_info)
+    return dict(user_info)
+
+def _load_user_information():
+    """Read user information from the database"""
     with get_db_connection() as conn:
         cursor = conn.cursor()
         
@@ -235,3 +548,30 @@ def get_user_information():
                 "created_at": now,
                 "updated_at": now
             }
+
+def get_cached_llm_response(key, max_age_seconds):
+    """Get a cached LLM response if it exists and is younger than max_age_seconds"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        
+        cutoff = (datetime.datetime.now() - datetime.timedelta(seconds=max_age_seconds)).strftime("%Y-%m-%d %H:%M:%S")
+        
+        cursor.execute('SELECT response FROM llm_cache WHERE key = ? AND created_at >= ?', (key, cutoff))
+        row = cursor.fetchone()
+        
+        return row["response"] if row else None
+
+def save_llm_response(key, response):
+    """Save an LLM response to the cache"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        cursor.execute('''
+        INSERT OR REPLACE INTO llm_cache (key, response, created_at)
+        VALUES (?, ?, ?)
+        ''', (key, response, now))
+        
+        conn.commit()
+        return True
@@ -1,8 +1,20 @@
+# NOTE: The work in this module is string building, docx XML and file I/O, which JIT
+# compilers such as Numba cannot speed up. Keep hot text handling on C-implemented
+# primitives instead (str.translate, re, str.join, lxml).
+import io
 import os
+import re
+import asyncio
+import logging
+import docx
 from docx import Document
 from docx.shared import Pt
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from xml.sax.saxutils import escape
 import datetime
 from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from app.ai_integration import generate_resume_suggestions, generate_cover_letter
 from app.file_handler import get_document_text
@@ -12,7 +24,82 @@ from app.database import get_user_information
 RESUME_FOLDER = "resumes"
 COVER_LETTER_FOLDER = "cover_letters"
 
-def create_custom_resume(base_resume_path, job_description, company_name=None, position=None, output_path=None):
+logger = logging.getLogger(__name__)
+
+# Blank lines (optionally containing whitespace) separate paragraphs in generated text
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+# python-docx's blank template, read once so each cover letter is built from memory
+_BASE_TEMPLATE_PATH = os.path.join(os.path.dirname(docx.__file__), "templates", "default.docx")
+with open(_BASE_TEMPLATE_PATH, "rb") as _template_file:
+    _BASE_TEMPLATE_BYTES = _template_file.read()
+
+# Characters that are not allowed in file names on common platforms, mapped to hyphens
+_SANITIZE = str.maketrans({c: "-" for c in r'/\:*?"<>|'})
+
+def _safe_filename_component(value):
+    """Replace characters that are invalid in file names with hyphens"""
+    return value.translate(_SANITIZE)
+
+def _resolve_resume_path(path):
+    """
+    Find a resume on disk, falling back to the file of the same name in RESUME_FOLDER
+    
+    Args:
+        path: Resume path as given by the client
+        
+    Returns:
+        str: A path that exists
+    """
+    try:
+        os.stat(path)
+        return path
+    except FileNotFoundError:
+        pass
+    
+    adjusted_path = os.path.join(RESUME_FOLDER, os.path.basename(path))
+    try:
+        os.stat(adjusted_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Resume file not found at path: {path}")
+    
+    logger.debug("Using adjusted resume path: %s", adjusted_path)
+    return adjusted_path
+
+def _paragraph_xml(text):
+    """Build the WordprocessingML for a plain paragraph, mirroring python-docx's handling of newlines and tabs"""
+    if not text:
+        return '<w:p/>'
+    runs = []
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            runs.append('<w:br/>')
+        for j, part in enumerate(line.split('\t')):
+            if j:
+                runs.append('<w:tab/>')
+            if part:
+                runs.append(f'<w:t xml:space="preserve">{escape(part)}</w:t>')
+    return f"<w:p><w:r>{''.join(runs)}</w:r></w:p>"
+
+def _append_paragraphs(doc, lines):
+    """
+    Append plain-text paragraphs to the end of a document with one XML parse
+    
+    Args:
+        doc: The python-docx Document to append to
+        lines: Paragraph texts, an empty string gives an empty spacer paragraph
+    """
+    fragment = parse_xml(f'<w:body {nsdecls("w")}>' + ''.join(_paragraph_xml(line) for line in lines) + '</w:body>')
+    body = doc.element.body
+    # Paragraphs must stay in front of the trailing section properties
+    sect_pr = body.sectPr
+    for paragraph in list(fragment):
+        if sect_pr is not None:
+            sect_pr.addprevious(paragraph)
+        else:
+            body.append(paragraph)
+
+async def create_custom_resume(base_resume_path, job_description, company_name=None, position=None, output_path=None):
     """
     Create a fully customized resume based on job description
     
@@ -26,66 +113,50 @@ def create_custom_resume(base_resume_path, job_description, company_name=None, p
     Returns:
         tuple: (output_path, customization_details)
     """
-    # Debug output
-    print(f"DEBUG - create_custom_resume called with:")
-    print(f"  base_resume_path: {base_resume_path}")
-    print(f"  job_description length: {len(job_description) if job_description else 0}")
-    print(f"  company_name: {company_name}")
-    print(f"  position: {position}")
-    print(f"  output_path: {output_path}")
-    print(f"  File exists: {os.path.exists(base_resume_path)}")
-    
-    # If using relative path, make sure it's relative to current working directory
-    if not os.path.isabs(base_resume_path) and not base_resume_path.startswith(RESUME_FOLDER):
-        adjusted_path = os.path.join(RESUME_FOLDER, os.path.basename(base_resume_path))
-        print(f"  Adjusted path: {adjusted_path}")
-        if os.path.exists(adjusted_path):
-            base_resume_path = adjusted_path
-            print(f"  Using adjusted path: {base_resume_path}")
-    
-    if not os.path.exists(base_resume_path):
-        raise HTTPException(status_code=404, detail=f"Resume file not found at path: {base_resume_path}")
-    
-    # Get the resume content
-    base_resume_text = get_document_text(base_resume_path)
+    # One timestamp for the whole call so the date and file name always agree
+    now = datetime.datetime.now()
+    
+    logger.debug(
+        "create_custom_resume: base_resume_path=%s job_description_length=%d company_name=%s position=%s output_path=%s",
+        base_resume_path, len(job_description or ""), company_name, position, output_path
+    )
+    
+    base_resume_path = _resolve_resume_path(base_resume_path)
     
     # Generate comprehensive resume customization suggestions
-    customization_details = generate_resume_suggestions(job_description)
+    customization_details = await generate_resume_suggestions(job_description)
     
     try:
         # Start with a fresh document
-        doc = Document(base_resume_path)
+        doc = await run_in_threadpool(Document, base_resume_path)
         
         # Save the customized resume with the new naming format
         if not output_path:
             # Create a formatted filename
             if company_name and position:
                 # Format today's date as YYYY-MM-DD
-                today_formatted = datetime.datetime.now().strftime("%Y-%m-%d")
+                today_formatted = now.strftime("%Y-%m-%d")
                 
                 # Clean up file name to ensure it's valid (replace invalid characters)
-                clean_company = company_name.replace('/', '-').replace('\\', '-').replace(':', '-').replace('*', '-').replace('?', '-').replace('"', '-').replace('<', '-').replace('>', '-').replace('|', '-')
-                clean_position = position.replace('/', '-').replace('\\', '-').replace(':', '-').replace('*', '-').replace('?', '-').replace('"', '-').replace('<', '-').replace('>', '-').replace('|', '-')
+                clean_company = _safe_filename_component(company_name)
+                clean_position = _safe_filename_component(position)
                 
                 # Create filename with hyphen separators instead of em dashes
                 filename = f"{clean_company}-{clean_position}-{today_formatted}.docx"
             else:
                 # Use timestamp based naming if company/position not provided
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 filename = f"custom_resume_{timestamp}.docx"
                 
             output_path = os.path.join(RESUME_FOLDER, filename)
-            
-            # Ensure directory exists
-            os.makedirs(RESUME_FOLDER, exist_ok=True)
         
-        doc.save(output_path)
+        await run_in_threadpool(doc.save, output_path)
         return output_path, customization_details
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating custom resume: {str(e)}")
 
-def create_cover_letter(job_description, company_name, position, resume_path, output_path=None):
+async def create_cover_letter(job_description, company_name, position, resume_path, output_path=None):
     """
     Create a cover letter based on job description, company, position and resume
     
@@ -99,105 +170,98 @@ def create_cover_letter(job_description, company_name, position, resume_path, ou
     Returns:
         tuple: (output_path, cover_letter_text)
     """
+    # One timestamp for the whole call so the date and file name always agree
+    now = datetime.datetime.now()
+    
     # Get user information
-    user_info = get_user_information()
-    print(f"DEBUG - User info retrieved: {user_info}")
-    # Debug output
-    print(f"DEBUG - create_cover_letter called with:")
-    print(f"  resume_path: {resume_path}")
-    print(f"  company_name: {company_name}")
-    print(f"  position: {position}")
-    print(f"  job_description length: {len(job_description) if job_description else 0}")
-    print(f"  output_path: {output_path}")
-    print(f"  File exists: {os.path.exists(resume_path)}")
-    
-    # If using relative path, make sure it's relative to current working directory
-    if not os.path.isabs(resume_path) and not resume_path.startswith(RESUME_FOLDER):
-        adjusted_path = os.path.join(RESUME_FOLDER, os.path.basename(resume_path))
-        print(f"  Adjusted path: {adjusted_path}")
-        if os.path.exists(adjusted_path):
-            resume_path = adjusted_path
-            print(f"  Using adjusted path: {resume_path}")
-    
-    if not os.path.exists(resume_path):
-        raise HTTPException(status_code=404, detail=f"Resume file not found at path: {resume_path}")
+    user_info = await run_in_threadpool(get_user_information)
+    logger.debug(
+        "create_cover_letter: resume_path=%s company_name=%s position=%s job_description_length=%d output_path=%s",
+        resume_path, company_name, position, len(job_description or ""), output_path
+    )
+    
+    resume_path = _resolve_resume_path(resume_path)
     
     # Extract resume content
-    resume_text = get_document_text(resume_path)
+    resume_text = await run_in_threadpool(get_document_text, resume_path)
     
     # Generate cover letter using Ollama
-    # The function will automatically pull user profile information as needed
-    cover_letter_text = generate_cover_letter(
+    # The profile was already loaded above, so pass it through instead of re-reading it
+    cover_letter_text = await generate_cover_letter(
         job_description, 
         company_name, 
         position, 
-        resume_text
+        resume_text,
+        applicant_name=user_info.get('full_name', ''),
+        applicant_email=user_info.get('email', ''),
+        applicant_phone=user_info.get('phone', ''),
+        applicant_address=user_info.get('address', ''),
+        use_profile=False
     )
     
     try:
-        # Create a new document
-        doc = Document()
+        # Collect every paragraph first ('' is an empty spacer paragraph), then
+        # append them with a single XML parse
+        lines = []
         
         # Add the user's contact information at the top
-        if user_info.get('full_name'):
-            doc.add_paragraph(user_info.get('full_name'))
-        if user_info.get('address'):
-            doc.add_paragraph(user_info.get('address'))
-        if user_info.get('phone'):
-            doc.add_paragraph(user_info.get('phone'))
-        if user_info.get('email'):
-            doc.add_paragraph(user_info.get('email'))
+        for field in ('full_name', 'address', 'phone', 'email'):
+            if user_info.get(field):
+                lines.append(user_info.get(field))
         
-        doc.add_paragraph()  # Add space after contact info
+        lines.append('')  # Add space after contact info
         
         # Add today's date in the format "Month Day, Year"
-        today_date = datetime.datetime.now().strftime("%B %d, %Y")
-        doc.add_paragraph(today_date)
-        doc.add_paragraph()
+        lines.extend([now.strftime("%B %d, %Y"), ''])
         
         # Add company info placeholders
-        doc.add_paragraph("Hiring Manager")
-        doc.add_paragraph(f"{company_name}")
-        doc.add_paragraph("Company Address")
-        doc.add_paragraph("City, State ZIP")
-        doc.add_paragraph()
+        lines.extend(["Hiring Manager", f"{company_name}", "Company Address", "City, State ZIP", ''])
         
         # Add greeting
-        doc.add_paragraph("Dear Hiring Manager,")
+        lines.append("Dear Hiring Manager,")
         
         # Add cover letter content
-        paragraphs = cover_letter_text.split('\n\n')
-        for para in paragraphs:
-            if para.strip():
-                doc.add_paragraph(para.strip())
+        lines.extend(filter(None, map(str.strip, _PARAGRAPH_BREAK.split(cover_letter_text))))
         
         # Add closing with user's name if available
-        doc.add_paragraph()
-        doc.add_paragraph("Sincerely,")
-        doc.add_paragraph()
-        if user_info.get('full_name'):
-            doc.add_paragraph(user_info.get('full_name'))
-        else:
-            doc.add_paragraph("[Your Name]")
+        lines.extend(['', "Sincerely,", '', user_info.get('full_name') or "[Your Name]"])
+        
+        doc = Document(io.BytesIO(_BASE_TEMPLATE_BYTES))
+        _append_paragraphs(doc, lines)
         
         # Save the cover letter with the format: CompanyName—Position—Date.docx
         if not output_path:
             # Format today's date as YYYY-MM-DD
-            today_formatted = datetime.datetime.now().strftime("%Y-%m-%d")
+            today_formatted = now.strftime("%Y-%m-%d")
             
             # Clean up file name to ensure it's valid (replace invalid characters)
-            clean_company = company_name.replace('/', '-').replace('\\', '-').replace(':', '-').replace('*', '-').replace('?', '-').replace('"', '-').replace('<', '-').replace('>', '-').replace('|', '-')
-            clean_position = position.replace('/', '-').replace('\\', '-').replace(':', '-').replace('*', '-').replace('?', '-').replace('"', '-').replace('<', '-').replace('>', '-').replace('|', '-')
+            clean_company = _safe_filename_component(company_name)
+            clean_position = _safe_filename_component(position)
             
             # Create filename with em dash separators
             filename = f"{clean_company}—{clean_position}—{today_formatted}.docx"
             output_path = os.path.join(COVER_LETTER_FOLDER, filename)
-            
-            # Ensure directory exists
-            os.makedirs(COVER_LETTER_FOLDER, exist_ok=True)
         
-        doc.save(output_path)
+        await run_in_threadpool(doc.save, output_path)
         return output_path, cover_letter_text
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating cover letter: {str(e)}")
+
+async def create_application_documents(resume_path, job_description, company_name, position):
+    """
+    Create a customized resume and a cover letter for the same job concurrently
+    
+    Args:
+        resume_path: Path to the base resume file
+        job_description: Job description text
+        company_name: Company name
+        position: Position title
+        
+    Returns:
+        tuple: ((resume_path, customization_details), (cover_letter_path, cover_letter_text))
+    """
+    return await asyncio.gather(
+        create_custom_resume(resume_path, job_description, company_name, position),
+        create_cover_letter(job_description, company_name, position, resume_path)
+    )
@@ -1,14 +1,17 @@
 import os
-import shutil
 import datetime
+import functools
+import aiofiles
 from fastapi import UploadFile, HTTPException
 from docx import Document
-import tempfile
 
 # Constants
 RESUME_FOLDER = "resumes"
 COVER_LETTER_FOLDER = "cover_letters"
 
+# Size of each read when streaming an upload to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 # Ensure folders exist
 os.makedirs(RESUME_FOLDER, exist_ok=True)
 os.makedirs(COVER_LETTER_FOLDER, exist_ok=True)
@@ -40,37 +43,57 @@ async def save_uploaded_file(file: UploadFile, folder: str) -> str:
     filename = f"{timestamp}_{original_filename}"
     filepath = os.path.join(folder, filename)
     
-    # Save the uploaded file
+    # Stream the upload to a .part file, then publish it atomically
+    part_path = filepath + ".part"
     try:
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            # Read the content in chunks and write to the temp file
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        async with aiofiles.open(part_path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await out.write(chunk)
         
-        # Move the temp file to the final destination
-        shutil.move(temp_file_path, filepath)
+        os.replace(part_path, filepath)
         
         return filepath
     except Exception as e:
         # Clean up if there's an error
-        if 'temp_file_path' in locals() and os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
+        if os.path.exists(part_path):
+            os.remove(part_path)
         raise HTTPException(status_code=500, detail=f"Error saving file: {str(e)}")
+    finally:
+        await file.close()
+
+# Upper bound on extracted document text; prompts are clipped further downstream
+DOCUMENT_TEXT_MAX_CHARS = 20_000
 
-def get_document_text(doc_path: str) -> str:
+@functools.lru_cache(maxsize=128)
+def _read_docx_cached(path: str, mtime_ns: int, size: int, max_chars: int) -> str:
+    """Extract up to max_chars of text from a DOCX file; the stat signature in the key invalidates stale entries"""
+    doc = Document(path)
+    parts = []
+    total = 0
+    for text in (paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()):
+        parts.append(text)
+        total += len(text) + 1  # Include the joining newline
+        if total >= max_chars:
+            break
+    return "\n".join(parts)[:max_chars]
+
+def get_document_text(doc_path: str, max_chars: int = DOCUMENT_TEXT_MAX_CHARS) -> str:
     """
     Extract text content from a DOCX file
     
+    Results are cached by (path, mtime, size), so an unchanged file is only parsed once.
+    
     Args:
         doc_path: Path to the DOCX file
+        max_chars: Maximum number of characters to return
         
     Returns:
         str: Text content of the document
     """
     try:
-        doc = Document(doc_path)
-        return "\n".join([paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()])
+        stat = os.stat(doc_path)
+        return _read_docx_cached(os.path.abspath(doc_path), stat.st_mtime_ns, stat.st_size, max_chars)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Document not found at path: {doc_path}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading document: {str(e)}")
@@ -1,17 +1,29 @@
 import os
-from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Query, Form
+import asyncio
+import logging
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Query, Form, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from typing import List, Optional
+from contextlib import asynccontextmanager
+from starlette.concurrency import run_in_threadpool
 import datetime
-import collections
+import functools
+import hashlib
+import time
+import orjson
 
 from app.database import (
     setup_database, 
+    close_db_connection,
     add_job_application, 
+    add_job_applications_bulk,
     update_job_application,
-    get_all_job_applications, 
+    get_job_applications_filtered,
+    get_job_application_statistics,
+    get_job_applications_version,
     get_job_application, 
+    JOB_APPLICATION_SUMMARY_COLUMNS,
     delete_job_application,
     save_user_information, 
     get_user_information
@@ -22,9 +34,11 @@ from app.models import (
     JobApplicationUpdate,
     User, 
     JobApplication, 
+    JobApplicationSummary,
     ResumeCustomizationRequest,
     CoverLetterGenerationRequest, 
     DocumentResponse,
+    ApplicationDocumentsResponse,
     StatusUpdateRequest,
     JobApplicationStatistics,
     LLMSettingsUpdate,
@@ -32,36 +46,74 @@ from app.models import (
     LLMAvailabilityCheckRequest,
     LLMAvailabilityResponse
 )
-from app.file_handler import save_uploaded_file, RESUME_FOLDER, COVER_LETTER_FOLDER
+from app.file_handler import save_uploaded_file, get_document_text, RESUME_FOLDER, COVER_LETTER_FOLDER
 from app.ai_integration import (
     check_ollama_availability,
     check_provider_availability,
+    create_http_client,
+    close_http_client,
+    warm_up_ollama,
+    stream_cover_letter,
     llm_settings
 )
 from app.utils import update_env_file
-from app.document_handlers import create_custom_resume, create_cover_letter
+from app.document_handlers import create_custom_resume, create_cover_letter, create_application_documents
+
+# Application log level (DEBUG shows the document generation details)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the database and the shared Ollama HTTP client, and warm up the model in the background"""
+    setup_database()
+    app.state.http = create_http_client()
+    # Loading a cold model can take minutes; the server starts serving requests meanwhile
+    warm_up_task = None
+    if llm_settings.provider == "ollama":
+        warm_up_task = asyncio.create_task(warm_up_ollama())
+    try:
+        yield
+    finally:
+        if warm_up_task is not None:
+            warm_up_task.cancel()
+            try:
+                await warm_up_task
+            except asyncio.CancelledError:
+                pass
+        await close_http_client()
+        close_db_connection()
 
 # Create FastAPI app
 app = FastAPI(
     title="Job Application Tracker API",
     description="API for managing job applications, resumes, and cover letters",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
+# Frontend origins allowed to call the API (comma-separated CORS_ORIGINS overrides the dev defaults)
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS",
+        "http://localhost:3000,http://127.0.0.1:3000,http://localhost:5173"
+    ).split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins in development
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["content-type", "authorization", "if-none-match"],
+    expose_headers=["X-Total-Count", "ETag"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
-# Initialize database on startup
-@app.on_event("startup")
-async def startup_event():
-    setup_database()
-
 # Health check endpoint
 @app.get("/api/health")
 async def health_check():
@@ -72,7 +124,7 @@ async def health_check():
 @app.get("/api/ollama/status")
 async def ollama_status():
     """Check if Ollama is available"""
-    available, error = check_ollama_availability()
+    available, error = await check_ollama_availability()
     if available:
         return {"status": "available"}
     else:
@@ -86,22 +138,8 @@ async def get_llm_settings():
 @app.post("/api/llm/settings", response_model=LLMSettingsResponse)
 async def update_llm_settings(settings: LLMSettingsUpdate):
     """Update LLM settings"""
-    # Extract settings from the request
-    update_args = {}
-    
-    # Only include non-None values
-    if settings.provider is not None:
-        update_args["provider"] = settings.provider
-    if settings.openai_api_key is not None:
-        update_args["openai_api_key"] = settings.openai_api_key
-    if settings.anthropic_api_key is not None:
-        update_args["anthropic_api_key"] = settings.anthropic_api_key
-    if settings.openai_model is not None:
-        update_args["openai_model"] = settings.openai_model
-    if settings.anthropic_model is not None:
-        update_args["anthropic_model"] = settings.anthropic_model
-    if settings.ollama_model is not None:
-        update_args["ollama_model"] = settings.ollama_model
+    # Only fields the client actually sent are applied
+    update_args = settings.model_dump(exclude_none=True)
     
     # Update settings in memory
     llm_settings.update_settings(**update_args)
@@ -119,7 +157,7 @@ async def update_llm_settings(settings: LLMSettingsUpdate):
 @app.post("/api/llm/check-availability", response_model=LLMAvailabilityResponse)
 async def check_llm_availability(request: LLMAvailabilityCheckRequest):
     """Check if a specific LLM provider is available"""
-    available, error = check_provider_availability(request.provider)
+    available, error = await check_provider_availability(request.provider)
     return {
         "provider": request.provider,
         "available": available,
@@ -130,19 +168,20 @@ async def check_llm_availability(request: LLMAvailabilityCheckRequest):
 @app.post("/api/user", response_model=User)
 async def create_or_update_user(user: UserCreate):
     """Create or update user information"""
-    save_user_information(user.full_name, user.address, user.phone, user.email)
-    return get_user_information()
+    await run_in_threadpool(save_user_information, user.full_name, user.address, user.phone, user.email)
+    return await run_in_threadpool(get_user_information)
 
 @app.get("/api/user", response_model=User)
 async def read_user():
     """Get user information"""
-    return get_user_information()
+    return await run_in_threadpool(get_user_information)
 
 # Job Application Endpoints
 @app.post("/api/applications", response_model=JobApplication)
 async def create_job_application(application: JobApplicationCreate):
     """Create a new job application"""
-    job_id = add_job_application(
+    return await run_in_threadpool(
+        add_job_application,
         company_name=application.company_name,
         position=application.position,
         date_applied=application.date_applied,
@@ -156,10 +195,27 @@ async def create_job_application(application: JobApplicationCreate):
         cover_letter_path=None,
         uploaded_resume_path=application.uploaded_resume_path
     )
-    return get_job_application(job_id)
 
-@app.get("/api/applications", response_model=List[JobApplication])
+@app.post("/api/applications/bulk")
+async def create_job_applications_bulk(applications: List[JobApplicationCreate]):
+    """Create many job applications at once (e.g. when importing)"""
+    created = await run_in_threadpool(add_job_applications_bulk, [application.model_dump() for application in applications])
+    return {"created": created}
+
+# How long (in seconds) a page of applications is reused even without writes
+APPLICATIONS_CACHE_TTL = 2
+
+@functools.lru_cache(maxsize=64)
+def _cached_application_page(version, ttl_bucket, status, search, limit, offset):
+    """Fetch one page of applications; the write version and TTL bucket in the key invalidate it"""
+    return get_job_applications_filtered(
+        status=status, search=search, limit=limit, offset=offset,
+        columns=JOB_APPLICATION_SUMMARY_COLUMNS
+    )
+
+@app.get("/api/applications", response_model=List[JobApplicationSummary])
 async def read_job_applications(
+    response: Response,
     status: Optional[str] = None,
     search: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
@@ -173,104 +229,165 @@ async def read_job_applications(
     - limit: Maximum number of results to return
     - offset: Number of results to skip
     """
-    applications = get_all_job_applications()
-    
-    # Apply filters if provided
-    if status:
-        applications = [app for app in applications if app["status"] == status]
-    
-    if search:
-        search = search.lower()
-        filtered_apps = []
-        for app in applications:
-            if (search in app["company_name"].lower() or 
-                search in app["position"].lower() or 
-                (app["job_description"] and search in app["job_description"].lower())):
-                filtered_apps.append(app)
-        applications = filtered_apps
+    # Filtering and pagination run in SQL (cached until the next write); the total is exposed as a header
+    applications, total = await run_in_threadpool(
+        _cached_application_page,
+        get_job_applications_version(),
+        int(time.monotonic() // APPLICATIONS_CACHE_TTL),
+        status, search, limit, offset
+    )
+    response.headers["X-Total-Count"] = str(total)
+    return applications
+
+async def require_job(job_id: int) -> dict:
+    """
+    Dependency that loads the job application named in the path
     
-    # Apply pagination
-    total = len(applications)
-    applications = applications[offset:offset + limit]
+    FastAPI caches dependency results per request, so routes and other dependencies
+    that declare it share a single lookup.
     
-    return applications
+    Args:
+        job_id: Job application ID from the path
+        
+    Returns:
+        dict: The job application (raises 404 if it does not exist)
+    """
+    return await run_in_threadpool(get_job_application, job_id)
 
 @app.get("/api/applications/{job_id}", response_model=JobApplication)
-async def read_job_application(job_id: int):
+async def read_job_application(job: dict = Depends(require_job)):
     """Get a specific job application by ID"""
-    return get_job_application(job_id)
+    return job
 
 @app.put("/api/applications/{job_id}", response_model=JobApplication)
 async def update_job_application_endpoint(job_id: int, application: JobApplicationUpdate):
     """Update an existing job application"""
     # Filter out None values
-    update_data = {k: v for k, v in application.dict().items() if v is not None}
-    update_job_application(job_id, **update_data)
-    return get_job_application(job_id)
+    update_data = application.model_dump(exclude_none=True)
+    return await run_in_threadpool(update_job_application, job_id, **update_data)
 
 @app.patch("/api/applications/{job_id}/status", response_model=JobApplication)
 async def update_application_status(job_id: int, status_update: StatusUpdateRequest):
     """Update the status of a job application"""
-    update_job_application(job_id, status=status_update.status)
-    return get_job_application(job_id)
+    return await run_in_threadpool(update_job_application, job_id, status=status_update.status)
 
 @app.delete("/api/applications/{job_id}")
 async def delete_job_application_endpoint(job_id: int):
     """Delete a job application"""
-    delete_job_application(job_id)
+    await run_in_threadpool(delete_job_application, job_id)
     return {"message": f"Job application with ID {job_id} deleted successfully"}
 
+# How long (in seconds) the statistics payload is reused even without writes
+STATS_CACHE_TTL = 30
+
+@functools.lru_cache(maxsize=1)
+def _statistics_payload(version, ttl_bucket):
+    """
+    Serialize the statistics once per (write version, TTL bucket)
+    
+    Args:
+        version: Job application write counter, changes invalidate the cache
+        ttl_bucket: Current STATS_CACHE_TTL time window, bounds staleness across processes
+        
+    Returns:
+        tuple: (JSON body (bytes), ETag (str))
+    """
+    body = orjson.dumps(JobApplicationStatistics(**get_job_application_statistics()).model_dump())
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    return body, etag
+
 @app.get("/api/applications/stats/summary", response_model=JobApplicationStatistics)
-async def get_application_statistics():
-    """Get statistics about job applications"""
-    applications = get_all_job_applications()
+async def get_application_statistics(request: Request):
+    """Get statistics about job applications (cached, supports If-None-Match)"""
+    body, etag = await run_in_threadpool(
+        _statistics_payload,
+        get_job_applications_version(),
+        int(time.monotonic() // STATS_CACHE_TTL)
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
     
-    # Calculate statistics
-    status_counts = collections.Counter(app["status"] for app in applications)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
     
-    # Get applications by month
-    applications_by_month = {}
-    for app in applications:
-        month = app["date_applied"][:7]  # YYYY-MM format
-        if month in applications_by_month:
-            applications_by_month[month] += 1
-        else:
-            applications_by_month[month] = 1
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def _get_job_and_save_resume(job_id: Optional[int], resume: Optional[UploadFile]):
+    """
+    Look up a job application and save an uploaded resume concurrently
     
-    # Sort applications by date, most recent first
-    applications.sort(key=lambda x: x["date_applied"], reverse=True)
-    recent_applications = applications[:5]  # Get 5 most recent
+    Args:
+        job_id: Job application ID to load (optional)
+        resume: Uploaded resume to save in RESUME_FOLDER (optional)
+        
+    Returns:
+        tuple: (job dict or None, saved resume path or None)
+    """
+    # asyncio.sleep(0) stands in for whichever half is not needed and yields None
+    job, uploaded_path = await asyncio.gather(
+        run_in_threadpool(get_job_application, job_id) if job_id else asyncio.sleep(0),
+        save_uploaded_file(resume, RESUME_FOLDER) if resume else asyncio.sleep(0),
+        return_exceptions=True
+    )
     
-    return {
-        "total_applications": len(applications),
-        "status_counts": dict(status_counts),
-        "recent_applications": recent_applications,
-        "applications_by_month": applications_by_month
-    }
+    if isinstance(job, BaseException):
+        # Don't leave an orphaned upload behind when the job lookup failed
+        if isinstance(uploaded_path, str):
+            os.remove(uploaded_path)
+        raise job
+    if isinstance(uploaded_path, BaseException):
+        raise uploaded_path
+    
+    return job, uploaded_path
 
 # Resume Endpoints
+@functools.lru_cache(maxsize=1)
+def _list_resumes_cached(folder_mtime_ns, ttl_bucket):
+    """
+    List the resumes in RESUME_FOLDER and serialize the listing
+    
+    The folder's mtime changes whenever a file is added or removed; the TTL bucket
+    covers changes that land within the same mtime tick.
+    
+    Returns:
+        tuple: (JSON body (bytes), ETag (str))
+    """
+    # DirEntry carries the path and caches its stat result, so each file costs one stat call
+    with os.scandir(RESUME_FOLDER) as entries:
+        resumes = [
+            {
+                "filename": entry.name,
+                "path": entry.path,
+                "created_at": datetime.datetime.fromtimestamp(entry.stat().st_ctime).isoformat()
+            }
+            for entry in entries
+            if entry.name.endswith(".docx")
+        ]
+    
+    # Sort by creation time, newest first
+    resumes.sort(key=lambda x: x["created_at"], reverse=True)
+    
+    body = orjson.dumps({"resumes": resumes})
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    return body, etag
+
 @app.get("/api/resumes")
-async def list_resumes():
-    """List all available resumes"""
-    if not os.path.exists(RESUME_FOLDER):
+async def list_resumes(request: Request):
+    """List all available resumes (supports If-None-Match)"""
+    try:
+        folder_mtime_ns = os.stat(RESUME_FOLDER).st_mtime_ns
+    except FileNotFoundError:
         os.makedirs(RESUME_FOLDER, exist_ok=True)
         return {"resumes": []}
     
-    resumes = []
-    for filename in os.listdir(RESUME_FOLDER):
-        if filename.endswith(".docx"):
-            filepath = os.path.join(RESUME_FOLDER, filename)
-            # Get file creation/modification time for sorting
-            file_stats = os.stat(filepath)
-            resumes.append({
-                "filename": filename,
-                "path": filepath,
-                "created_at": datetime.datetime.fromtimestamp(file_stats.st_ctime).isoformat()
-            })
+    body, etag = await run_in_threadpool(
+        _list_resumes_cached, folder_mtime_ns, int(time.monotonic() // APPLICATIONS_CACHE_TTL)
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
     
-    # Sort by creation time, newest first
-    resumes.sort(key=lambda x: x["created_at"], reverse=True)
-    return {"resumes": resumes}
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @app.post("/api/resumes/upload")
 async def upload_resume(resume: UploadFile = File(...)):
@@ -289,22 +406,20 @@ async def customize_resume(
 ):
     """Customize a resume based on job description"""
     try:
-        # Log incoming request data for debugging
-        print(f"DEBUG - Customize Resume Request Parameters:")
-        print(f"  job_id: {job_id}")
-        print(f"  job_description length: {len(job_description) if job_description else 0}")
-        print(f"  resume_path: {resume_path}")
-        print(f"  Resume file provided: {resume is not None}")
-        print(f"  company_name: {company_name}")
-        print(f"  position: {position}")
+        logger.debug(
+            "Customize resume request: job_id=%s resume_path=%s resume_uploaded=%s company_name=%s position=%s",
+            job_id, resume_path, resume is not None, company_name, position
+        )
         
         # Check if we have the necessary data
         if not job_description and not job_id:
             raise HTTPException(status_code=400, detail="Either job_id or job_description is required")
         
+        # Load the job and save any uploaded resume at the same time
+        job, uploaded_path = await _get_job_and_save_resume(job_id, resume)
+        
         # Get job details if job_id is provided
-        if job_id:
-            job = get_job_application(job_id)
+        if job:
             job_description = job["job_description"]
             # Use job details for company/position if not explicitly provided
             if not company_name:
@@ -316,17 +431,16 @@ async def customize_resume(
                 resume_path = job.get("resume_path")
         
         # If a new resume was uploaded, use that
-        if resume:
-            print(f"DEBUG - Processing uploaded resume file: {resume.filename}")
-            resume_path = await save_uploaded_file(resume, RESUME_FOLDER)
-            print(f"DEBUG - Resume saved to: {resume_path}")
+        if uploaded_path:
+            logger.debug("Resume saved to %s", uploaded_path)
+            resume_path = uploaded_path
         
         if not resume_path:
             raise HTTPException(status_code=400, detail="No resume provided. Please upload a resume.")
         
         # Create the customized resume
-        print(f"DEBUG - Creating custom resume with path: {resume_path}")
-        output_path, suggestions = create_custom_resume(
+        logger.debug("Creating custom resume from %s", resume_path)
+        output_path, suggestions = await create_custom_resume(
             resume_path, 
             job_description, 
             company_name, 
@@ -338,29 +452,55 @@ async def customize_resume(
             "content_preview": suggestions
         }
     except Exception as e:
-        print(f"ERROR - Exception in customize_resume: {str(e)}")
+        logger.error("Exception in customize_resume: %s", e)
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(status_code=500, detail=f"Error customizing resume: {str(e)}")
 
+def _download_response(request: Request, file_path: str, filename: str, not_found_detail: str):
+    """
+    Serve a generated document with cache validators, answering 304 when the client copy is current
+    
+    Args:
+        request: The incoming request (for If-None-Match)
+        file_path: Path of the file to send
+        filename: Download file name
+        not_found_detail: Error detail used when the file does not exist
+        
+    Returns:
+        Response: FileResponse, or an empty 304 response
+    """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=not_found_detail)
+    
+    headers = {
+        "ETag": f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        "Cache-Control": "private, max-age=60"
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    
+    # FileResponse streams the file itself (no buffering in the app); reuse our stat so it does not stat again
+    return FileResponse(file_path, filename=filename, headers=headers, stat_result=st)
+
 @app.get("/api/resumes/{filename}")
-async def download_resume(filename: str):
+async def download_resume(filename: str, request: Request):
     """Download a resume file"""
     file_path = os.path.join(RESUME_FOLDER, filename)
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="Resume not found")
-    return FileResponse(file_path, filename=filename)
+    return _download_response(request, file_path, filename, "Resume not found")
 
 @app.delete("/api/resumes/{filename}")
 async def delete_resume(filename: str):
     """Delete a resume file"""
     file_path = os.path.join(RESUME_FOLDER, filename)
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="Resume not found")
     
     try:
         os.remove(file_path)
         return {"message": f"Resume {filename} deleted successfully"}
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Resume not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting resume: {str(e)}")
 
@@ -376,14 +516,10 @@ async def generate_cover_letter_endpoint(
 ):
     """Generate a cover letter based on job details and resume"""
     try:
-        # Log incoming request data for debugging
-        print(f"DEBUG - Generate Cover Letter Request Parameters:")
-        print(f"  job_id: {job_id}")
-        print(f"  company_name: {company_name}")
-        print(f"  position: {position}")
-        print(f"  job_description length: {len(job_description) if job_description else 0}")
-        print(f"  resume_path: {resume_path}")
-        print(f"  Resume file provided: {resume is not None}")
+        logger.debug(
+            "Generate cover letter request: job_id=%s company_name=%s position=%s resume_path=%s resume_uploaded=%s",
+            job_id, company_name, position, resume_path, resume is not None
+        )
         
         # Check if we have the necessary data
         if not job_id and (not company_name or not position or not job_description):
@@ -392,9 +528,11 @@ async def generate_cover_letter_endpoint(
                 detail="Either job_id or (company_name, position, and job_description) are required"
             )
         
+        # Load the job and save any uploaded resume at the same time
+        job, uploaded_path = await _get_job_and_save_resume(job_id, resume)
+        
         # Get job details if job_id is provided
-        if job_id:
-            job = get_job_application(job_id)
+        if job:
             company_name = job["company_name"]
             position = job["position"]
             job_description = job["job_description"]
@@ -403,37 +541,124 @@ async def generate_cover_letter_endpoint(
                 resume_path = job.get("resume_path")
         
         # If a new resume was uploaded, use that
-        if resume:
-            print(f"DEBUG - Processing uploaded resume file: {resume.filename}")
-            resume_path = await save_uploaded_file(resume, RESUME_FOLDER)
-            print(f"DEBUG - Resume saved to: {resume_path}")
+        if uploaded_path:
+            logger.debug("Resume saved to %s", uploaded_path)
+            resume_path = uploaded_path
         
         if not resume_path:
             raise HTTPException(status_code=400, detail="No resume provided. Please upload a resume.")
         
         # Create the cover letter
-        output_path, cover_letter_text = create_cover_letter(
+        output_path, cover_letter_text = await create_cover_letter(
             job_description, company_name, position, resume_path
         )
         
         # If this is for an existing job, update the cover letter path
         if job_id:
-            update_job_application(job_id, cover_letter_path=output_path)
+            await run_in_threadpool(update_job_application, job_id, cover_letter_path=output_path)
         
         return {
             "document_path": output_path,
             "content_preview": cover_letter_text
         }
     except Exception as e:
-        print(f"ERROR - Exception in generate_cover_letter: {str(e)}")
+        logger.error("Exception in generate_cover_letter: %s", e)
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(status_code=500, detail=f"Error generating cover letter: {str(e)}")
 
+@app.post("/api/cover-letters/stream")
+async def stream_cover_letter_endpoint(request: CoverLetterGenerationRequest):
+    """
+    Stream a cover letter as plain text while it is being generated
+    
+    The text is not saved as a document; use /api/cover-letters/generate for that.
+    """
+    company_name = request.company_name
+    position = request.position
+    job_description = request.job_description
+    resume_path = request.resume_path
+    
+    if request.job_id:
+        job = await run_in_threadpool(get_job_application, request.job_id)
+        company_name = job["company_name"]
+        position = job["position"]
+        job_description = job["job_description"]
+        resume_path = resume_path or job.get("resume_path")
+    
+    if not company_name or not position or not job_description:
+        raise HTTPException(
+            status_code=400, 
+            detail="Either job_id or (company_name, position, and job_description) are required"
+        )
+    
+    if not resume_path:
+        raise HTTPException(status_code=400, detail="No resume provided. Please upload a resume.")
+    
+    # Raises 404 if the resume does not exist
+    resume_text = await run_in_threadpool(get_document_text, resume_path)
+    
+    # Check availability up front, the status code cannot change once streaming starts
+    available, error = await check_provider_availability()
+    if not available:
+        raise HTTPException(
+            status_code=503,
+            detail=f"{llm_settings.provider.capitalize()} is not available. Details: {error}"
+        )
+    
+    return StreamingResponse(
+        stream_cover_letter(job_description, company_name, position, resume_text),
+        media_type="text/plain"
+    )
+
 @app.get("/api/cover-letters/{filename}")
-async def download_cover_letter(filename: str):
+async def download_cover_letter(filename: str, request: Request):
     """Download a cover letter file"""
     file_path = os.path.join(COVER_LETTER_FOLDER, filename)
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="Cover letter not found")
-    return FileResponse(file_path, filename=filename)
+    return _download_response(request, file_path, filename, "Cover letter not found")
+
+# Combined Document Endpoints
+@app.post("/api/applications/{job_id}/documents", response_model=ApplicationDocumentsResponse)
+async def generate_application_documents(
+    job_id: int,
+    resume: Optional[UploadFile] = File(None),
+    resume_path: Optional[str] = Form(None)
+):
+    """Generate a customized resume and a cover letter for a job application in one request"""
+    try:
+        job, uploaded_path = await _get_job_and_save_resume(job_id, resume)
+        
+        # If a new resume was uploaded, use that, otherwise fall back to the job's resume
+        if uploaded_path:
+            resume_path = uploaded_path
+        elif not resume_path:
+            resume_path = job.get("resume_path")
+        
+        if not resume_path:
+            raise HTTPException(status_code=400, detail="No resume provided. Please upload a resume.")
+        
+        # Both generations run concurrently
+        (resume_output, suggestions), (cover_letter_output, cover_letter_text) = await create_application_documents(
+            resume_path,
+            job["job_description"],
+            job["company_name"],
+            job["position"]
+        )
+        
+        await run_in_threadpool(update_job_application, job_id, cover_letter_path=cover_letter_output)
+        
+        return {
+            "resume": {
+                "document_path": resume_output,
+                "content_preview": suggestions
+            },
+            "cover_letter": {
+                "document_path": cover_letter_output,
+                "content_preview": cover_letter_text
+            }
+        }
+    except Exception as e:
+        logger.error("Exception in generate_application_documents: %s", e)
+        if isinstance(e, HTTPException):
+            raise e
+        raise HTTPException(status_code=500, detail=f"Error generating documents: {str(e)}")
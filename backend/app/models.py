@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from typing import Optional, List, Dict, Literal
 from datetime import datetime
 
@@ -52,8 +52,7 @@ class User(UserBase):
     created_at: str
     updated_at: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class JobApplication(JobApplicationBase):
     id: int
@@ -62,14 +61,23 @@ class JobApplication(JobApplicationBase):
     created_at: str
     updated_at: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+class JobApplicationSummary(BaseModel):
+    """Lightweight job application returned by list views"""
+    id: int
+    company_name: str
+    position: str
+    status: str
+    date_applied: str
 
 # Additional specialized models
 class ResumeCustomizationRequest(BaseModel):
     job_id: Optional[int] = None
     job_description: Optional[str] = None
     resume_path: Optional[str] = None
+    company_name: Optional[str] = None
+    position: Optional[str] = None
 
 class CoverLetterGenerationRequest(BaseModel):
     job_id: Optional[int] = None
@@ -82,13 +90,17 @@ class DocumentResponse(BaseModel):
     document_path: str
     content_preview: str
 
+class ApplicationDocumentsResponse(BaseModel):
+    resume: DocumentResponse
+    cover_letter: DocumentResponse
+
 class StatusUpdateRequest(BaseModel):
     status: str
 
 class JobApplicationStatistics(BaseModel):
     total_applications: int
     status_counts: dict
-    recent_applications: List[JobApplication]
+    recent_applications: List[JobApplicationSummary]
     applications_by_month: dict
 
 # LLM Settings Models
@@ -1,5 +1,38 @@
 import os
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+
+# Path to the .env file in the root directory
+ENV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env')
+
+# Parsed .env contents, keyed by the (mtime_ns, size) of the file they were read from
+_env_cache = {"stamp": None, "values": {}}
+
+def _read_env_file(env_path):
+    """
+    Read the .env file, reusing the last parse while the file is unchanged
+    
+    Args:
+        env_path: Path to the .env file
+    
+    Returns:
+        dict: Variables defined in the file (empty if it does not exist)
+    """
+    try:
+        st = os.stat(env_path)
+    except FileNotFoundError:
+        return {}
+    
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _env_cache["stamp"] != stamp:
+        _env_cache["values"] = dict(dotenv_values(env_path, interpolate=False))
+        _env_cache["stamp"] = stamp
+    return dict(_env_cache["values"])
+
+def _format_env_value(value):
+    """Quote a value when writing it bare would not read back the same"""
+    if value and not any(c.isspace() or c in '#"\'\\' for c in value):
+        return value
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
 
 def update_env_file(openai_api_key=None, anthropic_api_key=None):
     """
@@ -9,31 +42,25 @@ def update_env_file(openai_api_key=None, anthropic_api_key=None):
         openai_api_key: OpenAI API key to save
         anthropic_api_key: Anthropic API key to save
     """
-    # Get the path to the .env file in the root directory
-    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    env_path = os.path.join(root_dir, '.env')
-    
-    # Load existing variables
-    load_dotenv(env_path)
-    
-    # Read existing .env file if it exists
-    env_contents = {}
-    if os.path.exists(env_path):
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_contents[key] = value
+    env_path = ENV_PATH
+    env_contents = _read_env_file(env_path)
     
     # Update API keys if provided
+    updates = {}
     if openai_api_key is not None:
-        env_contents['OPENAI_API_KEY'] = openai_api_key
+        updates['OPENAI_API_KEY'] = openai_api_key
     
     if anthropic_api_key is not None:
-        env_contents['ANTHROPIC_API_KEY'] = anthropic_api_key
+        updates['ANTHROPIC_API_KEY'] = anthropic_api_key
+    
+    # Nothing to write if every key already has the requested value
+    if all(env_contents.get(key) == value for key, value in updates.items()):
+        return
+    env_contents.update(updates)
     
-    # Write the updated .env file
-    with open(env_path, 'w') as f:
+    # Write to a temporary file and swap it in so readers never see a partial .env
+    tmp_path = env_path + '.tmp'
+    with open(tmp_path, 'w') as f:
         for key, value in env_contents.items():
-            f.write(f"{key}={value}\n")
+            f.write(f"{key}={_format_env_value(value)}\n" if value is not None else f"{key}\n")
+    os.replace(tmp_path, env_path)
@@ -0,0 +1,44 @@
+import pytest
+
+from app.ai_integration import JOB_DESCRIPTION_MAX_TOKENS, _clip, _clip_job_description
+
+POSTING = """About us
+Acme Robotics builds warehouse automation used by retailers across North America.
+
+Benefits include health, dental and vision coverage, a 401(k) match and a yearly learning budget.
+We also offer flexible hours.
+
+Requirements
+- 5+ years of Python
+- Experience with SQLite and FastAPI
+
+Acme Robotics is an equal opportunity employer. All qualified applicants will receive consideration.
+"""
+
+# Long enough that the posting is over JOB_DESCRIPTION_MAX_TOKENS
+FILLER = "\n\nResponsibilities\n" + "\n".join(f"- Own feature number {i} end to end" for i in range(250))
+
+def test_posting_under_budget_is_unchanged():
+    assert _clip_job_description(POSTING, JOB_DESCRIPTION_MAX_TOKENS) == POSTING
+
+def test_over_budget_posting_drops_only_boilerplate_paragraphs():
+    clipped = _clip_job_description(POSTING + FILLER, JOB_DESCRIPTION_MAX_TOKENS)
+    
+    # The company description and the requirements after "Benefits include" are kept
+    assert "Acme Robotics builds warehouse automation" in clipped
+    assert "- 5+ years of Python" in clipped
+    assert "- Experience with SQLite and FastAPI" in clipped
+    assert "Responsibilities" in clipped
+    # The benefits paragraph and the EEO sentence are gone
+    assert "401(k)" not in clipped
+    assert "flexible hours" not in clipped
+    assert "equal opportunity employer" not in clipped
+
+def test_clip_keeps_line_breaks():
+    text = "Jane Doe\nSenior Engineer\n\nPython  SQLite\nFastAPI"
+    # 7 tokens is 5 words
+    assert _clip(text, 7) == "Jane Doe\nSenior Engineer\n\nPython"
+    assert _clip(text, 100) == text
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,34 @@
+import pytest
+
+from app import database
+from app.database import get_user_information, save_user_information
+
+# A fresh database file for each test (every thread opens its own connection to it)
+@pytest.fixture
+def backend_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "job_applications.db"))
+    monkeypatch.setattr(database, "_user_information_cache", None)
+    database.close_db_connection()
+    
+    database.setup_database()
+    yield
+    
+    database.close_db_connection()
+
+def test_user_information_cache_not_stale_after_racing_save(backend_db, monkeypatch):
+    save_user_information("Jane Doe", "1 Old Street", "555-0100", "jane@old.example")
+    load_user_information = database._load_user_information
+    
+    # The save lands after the read has loaded the old row but before the cache stores it
+    def load_then_save():
+        user_info = load_user_information()
+        monkeypatch.setattr(database, "_load_user_information", load_user_information)
+        save_user_information("Jane Doe", "2 New Street", "555-0199", "jane@new.example")
+        return user_info
+    
+    monkeypatch.setattr(database, "_load_user_information", load_then_save)
+    assert get_user_information()["email"] == "jane@old.example"
+    assert get_user_information()["email"] == "jane@new.example"
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,33 @@
+import pytest
+
+import main
+
+# Tests marked slow (bulk stress tests) only run with --runslow
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", help="also run tests marked slow")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: stress test, skipped unless --runslow is given")
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, run with --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+# A fresh in-memory database for each test, served through main's own shared connection
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(main, "DB_PATH", ":memory:")
+    monkeypatch.setattr(main, "_db_conn", None)
+    monkeypatch.setattr(main, "_user_info_cache", None)
+    main._fetch_job_application.cache_clear()
+    
+    main.setup_database()
+    conn = main.get_db_connection()
+    yield conn
+    
+    main.close_db_connection()
+    main._fetch_job_application.cache_clear()
@@ -1,944 +1,1508 @@
-import os
-import json
-import sqlite3
-import datetime
-import gradio as gr
-import pandas as pd
-import requests
-from docx import Document
-from docx.shared import Pt
-import tempfile
-import shutil
-
-# Constants
-OLLAMA_API_URL = "http://localhost:11434/api/generate"
-DB_PATH = "job_applications.db"
-RESUME_FOLDER = "resumes"
-COVER_LETTER_FOLDER = "cover_letters"
-
-# Ensure folders exist
-os.makedirs(RESUME_FOLDER, exist_ok=True)
-os.makedirs(COVER_LETTER_FOLDER, exist_ok=True)
-
-# Database setup
-def setup_database():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    # Create job applications table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS job_applications (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        company_name TEXT NOT NULL,
-        position TEXT NOT NULL,
-        date_applied TEXT NOT NULL,
-        job_description TEXT,
-        status TEXT NOT NULL,
-        salary_info TEXT,
-        contact_info TEXT,
-        application_url TEXT,
-        notes TEXT,
-        resume_path TEXT,
-        cover_letter_path TEXT,
-        created_at TEXT NOT NULL,
-        updated_at TEXT NOT NULL
-    )
-    ''')
-    
-    # Create user information table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS user_information (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        full_name TEXT NOT NULL,
-        address TEXT,
-        phone TEXT,
-        email TEXT NOT NULL,
-        created_at TEXT NOT NULL,
-        updated_at TEXT NOT NULL
-    )
-    ''')
-    
-    conn.commit()
-    conn.close()
-
-# Ollama integration
-def check_ollama_availability():
-    try:
-        response = requests.get("http://localhost:11434/api/version")
-        response.raise_for_status()
-        return True, None
-    except Exception as e:
-        return False, str(e)
-
-def generate_text_with_ollama(prompt, model="qwen2.5:14b"):
-    # Check if Ollama is available
-    available, error = check_ollama_availability()
-    if not available:
-        return f"Error: Ollama is not available. Please make sure Ollama is running. Details: {error}"
-    
-    try:
-        response = requests.post(
-            OLLAMA_API_URL,
-            json={
-                "model": model,
-                "prompt": prompt,
-                "stream": False
-            }
-        )
-        response.raise_for_status()
-        return response.json().get("response", "")
-    except Exception as e:
-        error_msg = str(e)
-        if "404" in error_msg:
-            return "Error: The API endpoint was not found. Please check if Ollama is running correctly and the API URL is correct."
-        elif "Connection refused" in error_msg:
-            return "Error: Connection refused. Please make sure Ollama is running."
-        else:
-            return f"Error generating text with Ollama: {error_msg}"
-
-# Document processing functions
-def create_custom_resume(base_resume_path, job_description, output_path=None):
-    # Generate tailored content using Ollama
-    prompt = f"""
-    I have a job description and need to customize my resume for it.
-    
-    Job Description:
-    {job_description}
-    
-    Please analyze this job description and provide specific suggestions on how I should tailor my resume.
-    Focus on:
-    1. Skills to emphasize
-    2. Experience to highlight
-    3. Achievements that would be most relevant
-    4. Keywords to include
-    
-    Format your response as specific, actionable bullet points I can use to modify my resume.
-    """
-    
-    tailoring_suggestions = generate_text_with_ollama(prompt)
-    
-    # Load the base resume
-    doc = Document(base_resume_path)
-    
-    # Add tailoring suggestions at the end
-    # Check if the style exists in the document
-    try:
-        doc.add_heading("Tailoring Suggestions", level=1)
-    except KeyError:
-        # If the style doesn't exist, use a paragraph with manual formatting
-        p = doc.add_paragraph("Tailoring Suggestions")
-        p.runs[0].bold = True
-        p.runs[0].font.size = Pt(16)  # Approximate size for Heading 1
-    
-    doc.add_paragraph(tailoring_suggestions)
-    
-    # Save the customized resume
-    if not output_path:
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(RESUME_FOLDER, f"custom_resume_{timestamp}.docx")
-    
-    doc.save(output_path)
-    return output_path, tailoring_suggestions
-
-def generate_cover_letter(job_description, company_name, position, resume_path, output_path=None):
-    # Extract resume content
-    doc = Document(resume_path)
-    resume_text = "\n".join([paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()])
-    
-    # Get user information
-    user_info = get_user_information()
-    
-    # Generate cover letter using Ollama
-    prompt = f"""
-    Write a professional cover letter for a {position} position at {company_name}.
-    
-    Job Description:
-    {job_description}
-    
-    My Resume:
-    {resume_text}
-    
-    The cover letter should:
-    1. Be professionally formatted
-    2. Highlight relevant skills and experience from my resume that match the job requirements
-    3. Show enthusiasm for the role and company
-    4. Include a strong opening and closing
-    5. Be approximately 300-400 words
-    6. Only mention skills and experience that are actually in my resume
-    7. Specifically mention the company name ({company_name}) and position ({position})
-    8. Reference specific requirements or qualifications from the job description
-    
-    Write the complete cover letter text, ready to be used.
-    """
-    
-    cover_letter_text = generate_text_with_ollama(prompt)
-    
-    # Create a new document
-    doc = Document()
-    
-    # Add user information at the top if available
-    if user_info["full_name"]:
-        doc.add_paragraph(user_info["full_name"])
-        if user_info["address"]:
-            doc.add_paragraph(user_info["address"])
-        if user_info["phone"]:
-            doc.add_paragraph(user_info["phone"])
-        if user_info["email"]:
-            doc.add_paragraph(user_info["email"])
-    else:
-        doc.add_paragraph("Your Name")
-        doc.add_paragraph("Your Address")
-        doc.add_paragraph("Your Phone")
-        doc.add_paragraph("Your Email")
-    
-    # Add date
-    doc.add_paragraph(datetime.datetime.now().strftime("%B %d, %Y"))
-    doc.add_paragraph()
-    
-    # Add company info
-    doc.add_paragraph("Hiring Manager")
-    doc.add_paragraph(f"{company_name}")
-    doc.add_paragraph("Company Address")
-    doc.add_paragraph("City, State ZIP")
-    doc.add_paragraph()
-    
-    # Add greeting
-    doc.add_paragraph("Dear Hiring Manager,")
-    
-    # Add cover letter content
-    paragraphs = cover_letter_text.split('\n\n')
-    for para in paragraphs:
-        if para.strip():
-            doc.add_paragraph(para.strip())
-    
-    # Add closing
-    doc.add_paragraph()
-    doc.add_paragraph("Sincerely,")
-    doc.add_paragraph()
-    doc.add_paragraph(user_info["full_name"] if user_info["full_name"] else "Your Name")
-    
-    # Save the cover letter
-    if not output_path:
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(COVER_LETTER_FOLDER, f"cover_letter_{timestamp}.docx")
-    
-    doc.save(output_path)
-    return output_path, cover_letter_text
-
-# User information operations
-def save_user_information(full_name, address, phone, email):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Check if user information already exists
-    cursor.execute('SELECT COUNT(*) FROM user_information')
-    count = cursor.fetchone()[0]
-    
-    if count > 0:
-        # Update existing record
-        cursor.execute('''
-        UPDATE user_information
-        SET full_name = ?, address = ?, phone = ?, email = ?, updated_at = ?
-        WHERE id = 1
-        ''', (full_name, address, phone, email, now))
-    else:
-        # Insert new record
-        cursor.execute('''
-        INSERT INTO user_information (
-            full_name, address, phone, email, created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?)
-        ''', (full_name, address, phone, email, now, now))
-    
-    conn.commit()
-    conn.close()
-    return True
-
-def get_user_information():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM user_information LIMIT 1')
-    row = cursor.fetchone()
-    
-    conn.close()
-    return dict(row) if row else {"full_name": "", "address": "", "phone": "", "email": ""}
-
-# Database operations
-def add_job_application(company_name, position, date_applied, job_description, status, 
-                       salary_info=None, contact_info=None, application_url=None, notes=None,
-                       resume_path=None, cover_letter_path=None):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    cursor.execute('''
-    INSERT INTO job_applications (
-        company_name, position, date_applied, job_description, status,
-        salary_info, contact_info, application_url, notes,
-        resume_path, cover_letter_path, created_at, updated_at
-    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        company_name, position, date_applied, job_description, status,
-        salary_info, contact_info, application_url, notes,
-        resume_path, cover_letter_path, now, now
-    ))
-    
-    job_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    
-    return job_id
-
-def update_job_application(job_id, **kwargs):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    # Add updated_at timestamp
-    kwargs['updated_at'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Build the SET clause for the SQL query
-    set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
-    values = list(kwargs.values())
-    values.append(job_id)  # For the WHERE clause
-    
-    cursor.execute(f'''
-    UPDATE job_applications
-    SET {set_clause}
-    WHERE id = ?
-    ''', values)
-    
-    conn.commit()
-    conn.close()
-
-def get_all_job_applications():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM job_applications ORDER BY date_applied DESC')
-    rows = cursor.fetchall()
-    
-    applications = []
-    for row in rows:
-        applications.append(dict(row))
-    
-    conn.close()
-    return applications
-
-def get_job_application(job_id):
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM job_applications WHERE id = ?', (job_id,))
-    row = cursor.fetchone()
-    
-    conn.close()
-    return dict(row) if row else None
-
-def delete_job_application(job_id):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    # Get file paths before deletion
-    cursor.execute('SELECT resume_path, cover_letter_path FROM job_applications WHERE id = ?', (job_id,))
-    row = cursor.fetchone()
-    
-    # Delete from database
-    cursor.execute('DELETE FROM job_applications WHERE id = ?', (job_id,))
-    
-    conn.commit()
-    conn.close()
-    
-    # Delete associated files if they exist
-    if row:
-        resume_path, cover_letter_path = row
-        if resume_path and os.path.exists(resume_path):
-            os.remove(resume_path)
-        if cover_letter_path and os.path.exists(cover_letter_path):
-            os.remove(cover_letter_path)
-    
-    return True
-
-# Custom Theme
-def create_custom_theme():
-    return gr.themes.Soft(
-        primary_hue="indigo",
-        secondary_hue="blue",
-        neutral_hue="slate",
-        font=["Inter", "ui-sans-serif", "system-ui", "sans-serif"],
-    )
-
-# Gradio UI
-def create_ui():
-    # Set a custom theme
-    theme = create_custom_theme()
-    # CSS for custom styling
-    custom_css = """
-    .gradio-container {
-        max-width: 1200px !important;
-    }
-    
-    h1 {
-        text-align: center;
-        margin-bottom: 1.5rem;
-        color: #4f46e5;
-        font-weight: 700;
-        font-size: 2.5rem;
-    }
-    
-    .app-header {
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        margin-bottom: 1rem;
-        gap: 0.5rem;
-    }
-    
-    .app-header svg {
-        width: 32px;
-        height: 32px;
-    }
-    
-    .tab-header {
-        font-size: 1.25rem;
-        font-weight: 600;
-        margin-bottom: 1rem;
-        color: #4f46e5;
-        border-bottom: 2px solid #e5e7eb;
-        padding-bottom: 0.5rem;
-    }
-    
-    .info-box {
-        background-color: #f0f9ff;
-        border-left: 4px solid #3b82f6;
-        padding: 1rem;
-        margin-bottom: 1rem;
-        border-radius: 0.375rem;
-    }
-    
-    .success-message {
-        color: #047857;
-        font-weight: 500;
-    }
-    
-    .error-message {
-        color: #b91c1c;
-        font-weight: 500;
-    }
-    
-    .footer {
-        text-align: center;
-        margin-top: 2rem;
-        padding-top: 1rem;
-        border-top: 1px solid #e5e7eb;
-        color: #6b7280;
-        font-size: 0.875rem;
-    }
-    """
-    
-    # Helper function to refresh applications list
-    def refresh_applications_list():
-        print("Refreshing applications list...")
-        try:
-            applications = get_all_job_applications()
-            print(f"Retrieved {len(applications)} applications")
-            if applications:
-                df = pd.DataFrame(applications)
-                # Format the dataframe for display
-                display_df = df[['id', 'company_name', 'position', 'date_applied', 'status']].copy()
-                return display_df
-            return pd.DataFrame(columns=['id', 'company_name', 'position', 'date_applied', 'status'])
-        except Exception as e:
-            print(f"Error in refresh_applications_list: {str(e)}")
-            return pd.DataFrame(columns=['id', 'company_name', 'position', 'date_applied', 'status'])
-    
-    # Helper function to save uploaded resume
-    def save_uploaded_resume(file):
-        print("In save_uploaded_resume function...")
-        if file is None:
-            print("No file provided")
-            return None
-        
-        try:
-            # Create a unique filename
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"base_resume_{timestamp}.docx"
-            filepath = os.path.join(RESUME_FOLDER, filename)
-            
-            print(f"File info: {file}")
-            print(f"Saving to: {filepath}")
-            
-            # Save the uploaded file
-            shutil.copy(file.name, filepath)
-            print(f"File saved successfully to {filepath}")
-            return filepath
-        except Exception as e:
-            print(f"Error in save_uploaded_resume: {str(e)}")
-            return None
-    
-    # Add Job Application Tab
-    with gr.Blocks(theme=theme) as app:
-        with gr.Row(elem_classes="app-header"):
-            gr.Markdown("""
-            <h1>
-                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor">
-                    <path d="M4.5 6.375a4.125 4.125 0 118.25 0 4.125 4.125 0 01-8.25 0zM14.25 8.625a3.375 3.375 0 116.75 0 3.375 3.375 0 01-6.75 0zM1.5 19.125a7.125 7.125 0 0114.25 0v.003l-.001.119a.75.75 0 01-.363.63 13.067 13.067 0 01-6.761 1.873c-2.472 0-4.786-.684-6.76-1.873a.75.75 0 01-.364-.63l-.001-.122zM17.25 19.128l-.001.144a2.25 2.25 0 01-.233.96 10.088 10.088 0 005.06-1.01.75.75 0 00.42-.643 4.875 4.875 0 00-6.957-4.611 8.586 8.586 0 011.71 5.157v.003z" />
-                </svg>
-                Job Application Tracker
-            </h1>
-            """)
-        
-        # State variables
-        base_resume_path = gr.State(None)
-        current_job_id = gr.State(None)
-        
-        with gr.Tabs() as tabs:
-            # Tab 1: User Information
-            with gr.TabItem("User Information", id="user-info-tab"):
-                gr.Markdown('<div class="tab-header">Personal Information</div>')
-                
-                gr.Markdown('<div class="info-box">This information will be used in your cover letters and other application documents.</div>')
-                with gr.Row():
-                    with gr.Column():
-                        user_name = gr.Textbox(label="Full Name")
-                        user_address = gr.Textbox(label="Address", lines=3)
-                    
-                    with gr.Column():
-                        user_phone = gr.Textbox(label="Phone Number")
-                        user_email = gr.Textbox(label="Email Address")
-                
-                with gr.Row():
-                    save_user_btn = gr.Button("Save User Information", variant="primary")
-                    load_user_btn = gr.Button("Load Saved Information", variant="secondary")
-                
-                user_info_result = gr.Textbox(label="Result", interactive=False, elem_classes=["result-box"])
-                
-                # Save user information
-                def save_user_info(name, address, phone, email):
-                    if not name or not email:
-                        return "Please provide at least your name and email address"
-                    
-                    try:
-                        save_user_information(name, address, phone, email)
-                        return "User information saved successfully!"
-                    except Exception as e:
-                        return f"Error saving user information: {str(e)}"
-                
-                # Load user information
-                def load_user_info():
-                    user_info = get_user_information()
-                    return (
-                        user_info.get("full_name", ""),
-                        user_info.get("address", ""),
-                        user_info.get("phone", ""),
-                        user_info.get("email", ""),
-                        "User information loaded successfully!"
-                    )
-                
-                # Connect event handlers
-                save_user_btn.click(
-                    save_user_info,
-                    inputs=[user_name, user_address, user_phone, user_email],
-                    outputs=[user_info_result]
-                )
-                
-                load_user_btn.click(
-                    load_user_info,
-                    inputs=[],
-                    outputs=[user_name, user_address, user_phone, user_email, user_info_result]
-                )
-            
-            # Tab 2: Add New Application
-            with gr.TabItem("Add Application", id="add-app-tab"):
-                gr.Markdown('<div class="tab-header">Add New Job Application</div>')
-                
-                gr.Markdown('<div class="info-box">Track a new job application by filling out the details below.</div>')
-                with gr.Row():
-                    with gr.Column():
-                        company_input = gr.Textbox(label="Company Name")
-                        position_input = gr.Textbox(label="Position")
-                        date_input = gr.Textbox(label="Date Applied", value=datetime.datetime.now().strftime("%Y-%m-%d"))
-                        status_input = gr.Dropdown(
-                            label="Status", 
-                            choices=["Applied", "Interviewing", "Rejected", "Offer", "Accepted", "Declined"],
-                            value="Applied"
-                        )
-                        salary_input = gr.Textbox(label="Salary Information (Optional)")
-                    
-                    with gr.Column():
-                        contact_input = gr.Textbox(label="Contact Information (Optional)")
-                        url_input = gr.Textbox(label="Application URL (Optional)")
-                        job_desc_input = gr.Textbox(label="Job Description", lines=10)
-                        notes_input = gr.Textbox(label="Notes (Optional)", lines=3)
-                
-                with gr.Row():
-                    base_resume_upload = gr.File(label="Upload Base Resume (DOCX)")
-                    
-                with gr.Row():
-                    add_btn = gr.Button("Add Job Application", variant="primary")
-                    clear_btn = gr.Button("Clear Form", variant="secondary")
-                
-                result_text = gr.Textbox(label="Result", interactive=False, elem_classes=["result-box"])
-                
-                # Add job application function
-                def add_application(company, position, date, job_desc, status, salary, contact, url, notes, resume_file, resume_path_state):
-                    print("Starting add_application function...")
-                    if not company or not position or not date:
-                        print("Missing required fields")
-                        return "Please fill in all required fields (Company, Position, Date)", resume_path_state
-                    
-                    try:
-                        # Save the base resume if provided
-                        resume_path = None
-                        if resume_file:
-                            print("Saving uploaded resume...")
-                            resume_path = save_uploaded_resume(resume_file)
-                            resume_path_state = resume_path
-                            print(f"Resume saved to {resume_path}")
-                        
-                        # Add to database
-                        print("Adding job application to database...")
-                        job_id = add_job_application(
-                            company, position, date, job_desc, status,
-                            salary, contact, url, notes, resume_path, None
-                        )
-                        print(f"Job application added with ID: {job_id}")
-                        
-                        return f"Job application added successfully! ID: {job_id}", resume_path_state
-                    except Exception as e:
-                        print(f"Error in add_application: {str(e)}")
-                        return f"Error adding job application: {str(e)}", resume_path_state
-                
-                # Clear form function
-                def clear_form():
-                    return "", "", datetime.datetime.now().strftime("%Y-%m-%d"), "", "Applied", "", "", "", "", None
-                
-                # Connect event handlers
-                add_btn.click(
-                    add_application,
-                    inputs=[
-                        company_input, position_input, date_input, job_desc_input, status_input,
-                        salary_input, contact_input, url_input, notes_input, base_resume_upload, base_resume_path
-                    ],
-                    outputs=[result_text, base_resume_path]
-                )
-                
-                clear_btn.click(
-                    clear_form,
-                    inputs=[],
-                    outputs=[
-                        company_input, position_input, date_input, job_desc_input, status_input,
-                        salary_input, contact_input, url_input, notes_input, base_resume_upload
-                    ]
-                )
-            
-            # Tab 3: View/Edit Applications
-            with gr.TabItem("View Applications", id="view-app-tab"):
-                gr.Markdown('<div class="tab-header">Manage Job Applications</div>')
-                
-                gr.Markdown('<div class="info-box">View, edit, or delete your existing job applications.</div>')
-                with gr.Row():
-                    refresh_btn = gr.Button("Refresh List", variant="primary", size="sm")
-                
-                applications_table = gr.DataFrame(
-                    headers=['ID', 'Company', 'Position', 'Date Applied', 'Status'],
-                    datatype=['number', 'str', 'str', 'str', 'str'],
-                    label="Job Applications"
-                )
-                
-                with gr.Row():
-                    selected_id_input = gr.Number(label="Selected Job ID", precision=0)
-                    load_btn = gr.Button("Load Application", variant="primary", size="sm")
-                    delete_btn = gr.Button("Delete Application", variant="stop", size="sm")
-                
-                with gr.Row():
-                    with gr.Column():
-                        edit_company = gr.Textbox(label="Company Name")
-                        edit_position = gr.Textbox(label="Position")
-                        edit_date = gr.Textbox(label="Date Applied")
-                        edit_status = gr.Dropdown(
-                            label="Status", 
-                            choices=["Applied", "Interviewing", "Rejected", "Offer", "Accepted", "Declined"]
-                        )
-                        edit_salary = gr.Textbox(label="Salary Information")
-                    
-                    with gr.Column():
-                        edit_contact = gr.Textbox(label="Contact Information")
-                        edit_url = gr.Textbox(label="Application URL")
-                        edit_job_desc = gr.Textbox(label="Job Description", lines=10)
-                        edit_notes = gr.Textbox(label="Notes", lines=3)
-                
-                with gr.Row():
-                    update_btn = gr.Button("Update Application", variant="primary")
-                
-                edit_result = gr.Textbox(label="Result", interactive=False, elem_classes=["result-box"])
-                
-                # Load applications on refresh
-                def load_applications():
-                    return refresh_applications_list()
-                
-                # Load specific application details
-                def load_application_details(job_id):
-                    if not job_id:
-                        return "Please enter a valid Job ID", "", "", "", "", "", "", "", "", None
-                    
-                    application = get_job_application(int(job_id))
-                    if not application:
-                        return "Job application not found", "", "", "", "", "", "", "", "", None
-                    
-                    return (
-                        f"Loaded application {job_id}",
-                        application["company_name"],
-                        application["position"],
-                        application["date_applied"],
-                        application["status"],
-                        application["salary_info"] or "",
-                        application["contact_info"] or "",
-                        application["application_url"] or "",
-                        application["job_description"] or "",
-                        application["notes"] or "",
-                        job_id
-                    )
-                
-                # Update application
-                def update_application(company, position, date, status, salary, contact, url, job_desc, notes, job_id):
-                    if not job_id:
-                        return "No application selected"
-                    
-                    update_job_application(
-                        job_id,
-                        company_name=company,
-                        position=position,
-                        date_applied=date,
-                        status=status,
-                        salary_info=salary,
-                        contact_info=contact,
-                        application_url=url,
-                        job_description=job_desc,
-                        notes=notes
-                    )
-                    
-                    return f"Application {job_id} updated successfully"
-                
-                # Delete application
-                def delete_application(job_id):
-                    if not job_id:
-                        return "Please enter a valid Job ID", None
-                    
-                    success = delete_job_application(int(job_id))
-                    if success:
-                        return f"Application {job_id} deleted successfully", None
-                    else:
-                        return f"Failed to delete application {job_id}", job_id
-                
-                # Connect event handlers
-                refresh_btn.click(
-                    load_applications,
-                    inputs=[],
-                    outputs=[applications_table]
-                )
-                
-                load_btn.click(
-                    load_application_details,
-                    inputs=[selected_id_input],
-                    outputs=[
-                        edit_result, edit_company, edit_position, edit_date, edit_status,
-                        edit_salary, edit_contact, edit_url, edit_job_desc, edit_notes, current_job_id
-                    ]
-                )
-                
-                update_btn.click(
-                    update_application,
-                    inputs=[
-                        edit_company, edit_position, edit_date, edit_status, edit_salary,
-                        edit_contact, edit_url, edit_job_desc, edit_notes, current_job_id
-                    ],
-                    outputs=[edit_result]
-                )
-                
-                delete_btn.click(
-                    delete_application,
-                    inputs=[selected_id_input],
-                    outputs=[edit_result, current_job_id]
-                )
-            
-            # Tab 4: Resume Customization
-            with gr.TabItem("Customize Resume", id="resume-tab"):
-                gr.Markdown('<div class="tab-header">Resume Customization</div>')
-                
-                gr.Markdown('<div class="info-box">Tailor your resume to match the job description using AI assistance.</div>')
-                with gr.Row():
-                    with gr.Column():
-                        resume_job_id = gr.Number(label="Job ID (Optional)", precision=0)
-                        load_job_btn = gr.Button("Load Job Details", variant="primary", size="sm")
-                    
-                    with gr.Column():
-                        resume_upload = gr.File(label="Upload Resume (DOCX)")
-                
-                resume_job_company = gr.Textbox(label="Company Name", interactive=False)
-                resume_job_position = gr.Textbox(label="Position", interactive=False)
-                resume_job_desc = gr.Textbox(label="Job Description", lines=10)
-                
-                customize_btn = gr.Button("Customize Resume", variant="primary")
-                
-                with gr.Row():
-                    resume_result = gr.Textbox(label="Customization Result", interactive=False)
-                    resume_download = gr.File(label="Download Customized Resume")
-                
-                # Load job details for resume customization
-                def load_job_for_resume(job_id, resume_path_state):
-                    if not job_id:
-                        return "Please enter a valid Job ID", "", "", resume_path_state
-                    
-                    application = get_job_application(int(job_id))
-                    if not application:
-                        return "Job application not found", "", "", resume_path_state
-                    
-                    return (
-                        f"Loaded job details for {application['company_name']}",
-                        application["company_name"],
-                        application["position"],
-                        application["job_description"] or "",
-                        resume_path_state
-                    )
-                
-                # Customize resume
-                def customize_resume(job_desc, resume_file, resume_path_state):
-                    if not job_desc:
-                        return "Please provide a job description", None, resume_path_state
-                    
-                    # Determine which resume to use
-                    resume_path = None
-                    if resume_file:
-                        resume_path = save_uploaded_resume(resume_file)
-                    elif resume_path_state:
-                        resume_path = resume_path_state
-                    else:
-                        return "Please upload a resume", None, resume_path_state
-                    
-                    # Create customized resume
-                    output_path, suggestions = create_custom_resume(resume_path, job_desc)
-                    
-                    return f"Resume customized successfully!\n\nSuggestions:\n{suggestions}", output_path, resume_path_state
-                
-                # Connect event handlers
-                load_job_btn.click(
-                    load_job_for_resume,
-                    inputs=[resume_job_id, base_resume_path],
-                    outputs=[resume_result, resume_job_company, resume_job_position, resume_job_desc, base_resume_path]
-                )
-                
-                customize_btn.click(
-                    customize_resume,
-                    inputs=[resume_job_desc, resume_upload, base_resume_path],
-                    outputs=[resume_result, resume_download, base_resume_path]
-                )
-            
-            # Tab 5: Cover Letter Generation
-            with gr.TabItem("Generate Cover Letter", id="cover-letter-tab"):
-                gr.Markdown('<div class="tab-header">Cover Letter Generation</div>')
-                
-                gr.Markdown('<div class="info-box">Generate a professional cover letter tailored to the job description using AI.</div>')
-                with gr.Row():
-                    with gr.Column():
-                        cl_job_id = gr.Number(label="Job ID (Optional)", precision=0)
-                        cl_load_job_btn = gr.Button("Load Job Details", variant="primary", size="sm")
-                    
-                    with gr.Column():
-                        cl_resume_upload = gr.File(label="Upload Resume (DOCX) *Required*")
-                
-                cl_company = gr.Textbox(label="Company Name")
-                cl_position = gr.Textbox(label="Position")
-                cl_job_desc = gr.Textbox(label="Job Description", lines=10)
-                cl_resume_path = gr.State(None)  # Hidden state to store resume path
-                
-                generate_cl_btn = gr.Button("Generate Cover Letter", variant="primary")
-                
-                with gr.Row():
-                    cl_result = gr.Textbox(label="Generated Cover Letter Preview", lines=10, interactive=False)
-                    cl_download = gr.File(label="Download Cover Letter")
-                
-                # Load job details for cover letter
-                def load_job_for_cl(job_id):
-                    if not job_id:
-                        return "Please enter a valid Job ID", "", "", "", None
-                    
-                    application = get_job_application(int(job_id))
-                    if not application:
-                        return "Job application not found", "", "", "", None
-                    
-                    # Get resume path if available
-                    resume_path = application.get("resume_path")
-                    resume_message = ""
-                    if resume_path and os.path.exists(resume_path):
-                        resume_message = f" (Resume found: {os.path.basename(resume_path)})"
-                    else:
-                        resume_path = None
-                        resume_message = " (No resume found, please upload one)"
-                    
-                    return (
-                        f"Loaded job details for {application['company_name']}{resume_message}",
-                        application["company_name"],
-                        application["position"],
-                        application["job_description"] or "",
-                        resume_path
-                    )
-                
-                # Generate cover letter
-                def generate_cover_letter_handler(company, position, job_desc, resume_file, resume_path_state):
-                    if not company or not position or not job_desc:
-                        return "Please fill in all fields", None, resume_path_state
-                    
-                    # Determine which resume to use
-                    resume_path = None
-                    if resume_file:
-                        resume_path = save_uploaded_resume(resume_file)
-                        resume_path_state = resume_path
-                    elif resume_path_state:
-                        resume_path = resume_path_state
-                    else:
-                        return "Please upload a resume or load a job with an existing resume", None, resume_path_state
-                    
-                    output_path, cover_letter_text = generate_cover_letter(job_desc, company, position, resume_path)
-                    
-                    return cover_letter_text, output_path, resume_path_state
-                
-                # Connect event handlers
-                cl_load_job_btn.click(
-                    load_job_for_cl,
-                    inputs=[cl_job_id],
-                    outputs=[cl_result, cl_company, cl_position, cl_job_desc, cl_resume_path]
-                )
-                
-                generate_cl_btn.click(
-                    generate_cover_letter_handler,
-                    inputs=[cl_company, cl_position, cl_job_desc, cl_resume_upload, cl_resume_path],
-                    outputs=[cl_result, cl_download, cl_resume_path]
-                )
-        
-        # Footer
-        gr.Markdown('<div class="footer">Job Application Tracker - Helping you organize your job search</div>')
-        
-        # Initialize the database on startup
-        def init_app():
-            setup_database()
-            return None
-        
-        app.load(init_app, inputs=None, outputs=None)
-    
-    return app
-
-# Main function
-def main():
-    app = create_ui()
-    app.launch(
-        share=False,
-    )
-
-if __name__ == "__main__":
-    main()
+import io
+import os
+import csv
+import atexit
+import asyncio
+import hashlib
+import sqlite3
+import datetime
+import threading
+import functools
+from collections import OrderedDict
+from contextlib import contextmanager
+import gradio as gr
+import httpx
+import orjson
+import docx
+from docx import Document
+from docx.shared import Pt
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+import tempfile
+import shutil
+import textwrap
+
+# Constants
+OLLAMA_BASE_URL = "http://localhost:11434"
+OLLAMA_API_URL = f"{OLLAMA_BASE_URL}/api/generate"
+DB_PATH = "job_applications.db"
+RESUME_FOLDER = "resumes"
+COVER_LETTER_FOLDER = "cover_letters"
+
+# Ensure folders exist
+os.makedirs(RESUME_FOLDER, exist_ok=True)
+os.makedirs(COVER_LETTER_FOLDER, exist_ok=True)
+
+# python-docx's blank template, read once so each cover letter is built from memory
+with open(os.path.join(os.path.dirname(docx.__file__), "templates", "default.docx"), "rb") as _template_file:
+    BLANK_DOCUMENT_BYTES = _template_file.read()
+
+# Database connection
+# One connection for the whole app, shared by Gradio's worker threads behind a lock
+_db_conn = None
+_db_lock = threading.RLock()
+
+def get_db_connection():
+    global _db_conn
+    if _db_conn is None:
+        # isolation_level=None: transactions are started explicitly in db_transaction()
+        _db_conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=128)
+        _db_conn.row_factory = sqlite3.Row
+        # WAL lets the list refresh read while a save is writing, and with synchronous=NORMAL
+        # commits no longer fsync. (For a one-off bulk seed of an empty database,
+        # journal_mode=OFF is faster still; switch back to WAL afterwards.)
+        _db_conn.execute("PRAGMA journal_mode=WAL")
+        _db_conn.execute("PRAGMA synchronous=NORMAL")
+        _db_conn.execute("PRAGMA temp_store=MEMORY")
+        _db_conn.execute("PRAGMA mmap_size=268435456")
+        _db_conn.execute("PRAGMA cache_size=-20000")
+    return _db_conn
+
+def close_db_connection():
+    global _db_conn
+    with _db_lock:
+        if _db_conn is not None:
+            # Refreshes the planner's statistics for tables whose queries would benefit;
+            # SQLite recommends it just before a connection closes, and it is usually a no-op
+            _db_conn.execute("PRAGMA optimize")
+            _db_conn.close()
+            _db_conn = None
+
+atexit.register(close_db_connection)
+
+@contextmanager
+def db_transaction():
+    # All statements inside run in one transaction (one commit instead of one per statement)
+    with _db_lock:
+        conn = get_db_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn.cursor()
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+@contextmanager
+def db_cursor():
+    # Reads don't need a transaction, only exclusive use of the shared connection
+    with _db_lock:
+        yield get_db_connection().cursor()
+
+# Database setup
+# Bump whenever SCHEMA_SQL changes; databases already at this version skip it
+SCHEMA_VERSION = 1
+
+SCHEMA_SQL = f'''
+-- Job applications table
+CREATE TABLE IF NOT EXISTS job_applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company_name TEXT NOT NULL,
+    position TEXT NOT NULL,
+    date_applied TEXT NOT NULL,
+    job_description TEXT,
+    status TEXT NOT NULL,
+    salary_info TEXT,
+    contact_info TEXT,
+    application_url TEXT,
+    notes TEXT,
+    resume_path TEXT,
+    cover_letter_path TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+-- Covering index for the applications list: SELECT_APPLICATION_SUMMARIES_SQL is read
+-- straight from it in date_applied order (id is the rowid, so every index carries it).
+-- It replaces the earlier date_applied-only index, which it makes redundant
+DROP INDEX IF EXISTS idx_job_applications_date_applied;
+CREATE INDEX IF NOT EXISTS idx_job_applications_list
+    ON job_applications(date_applied DESC, company_name, position, status);
+-- Index for status lookups
+CREATE INDEX IF NOT EXISTS idx_job_applications_status ON job_applications(status);
+
+-- User information table
+CREATE TABLE IF NOT EXISTS user_information (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    full_name TEXT NOT NULL,
+    address TEXT,
+    phone TEXT,
+    email TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+-- Cache of deterministic (temperature 0) Ollama responses, keyed by request hash
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+-- PRAGMA values can't be bound as parameters
+PRAGMA user_version = {SCHEMA_VERSION};
+'''
+
+def setup_database():
+    with _db_lock:
+        conn = get_db_connection()
+        # Stored in the database header, so this costs no table lookups
+        if conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
+        
+        # The whole schema in one executescript call and one transaction. The transaction is
+        # part of the script: executescript() would commit one opened by db_transaction() first
+        try:
+            conn.executescript(f'BEGIN IMMEDIATE;\n{SCHEMA_SQL}\nCOMMIT;')
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+
+# Ollama integration
+# One client for the whole app so connections to Ollama are kept alive between prompts
+http_client = httpx.AsyncClient(timeout=httpx.Timeout(600.0, connect=5.0))
+
+# How long Ollama keeps the model (and its prompt cache) loaded after a request
+OLLAMA_KEEP_ALIVE = "30m"
+
+# Temperature 0 responses are reused for this long (seconds); other temperatures are never cached
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+
+def ollama_payload(prompt, model, stream, temperature=None):
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": stream,
+        "keep_alive": OLLAMA_KEEP_ALIVE
+    }
+    if temperature is not None:
+        payload["options"] = {"temperature": temperature}
+    return payload
+
+def llm_cache_key(prompt, model, temperature):
+    # None for requests whose answers vary from call to call
+    if temperature != 0:
+        return None
+    return hashlib.sha256(f"{model}\0{temperature}\0{prompt}".encode("utf-8")).hexdigest()
+
+async def check_ollama_availability():
+    try:
+        response = await http_client.get(f"{OLLAMA_BASE_URL}/api/version")
+        response.raise_for_status()
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+async def generate_text_with_ollama(prompt, model="qwen2.5:14b", temperature=None):
+    cache_key = llm_cache_key(prompt, model, temperature)
+    if cache_key:
+        cached = await run_blocking(get_cached_llm_response, cache_key, LLM_CACHE_TTL)
+        if cached is not None:
+            return cached
+    
+    # No separate availability check here: a failed connection is reported by the request itself
+    try:
+        response = await http_client.post(
+            OLLAMA_API_URL,
+            json=ollama_payload(prompt, model, False, temperature)
+        )
+        response.raise_for_status()
+        text = orjson.loads(response.content).get("response", "")
+        if cache_key:
+            await run_blocking(save_llm_response, cache_key, text)
+        return text
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return "Error: The API endpoint was not found. Please check if Ollama is running correctly and the API URL is correct."
+        return f"Error generating text with Ollama: {str(e)}"
+    except httpx.ConnectError as e:
+        return f"Error: Ollama is not available. Please make sure Ollama is running. Details: {str(e)}"
+    except Exception as e:
+        return f"Error generating text with Ollama: {str(e)}"
+
+async def stream_text_with_ollama(prompt, model="qwen2.5:14b", temperature=None):
+    # Yields the response piece by piece while Ollama is still generating it
+    # (a cached response comes back as a single piece)
+    cache_key = llm_cache_key(prompt, model, temperature)
+    if cache_key:
+        cached = await run_blocking(get_cached_llm_response, cache_key, LLM_CACHE_TTL)
+        if cached is not None:
+            yield cached
+            return
+    
+    try:
+        async with http_client.stream(
+            "POST",
+            OLLAMA_API_URL,
+            json=ollama_payload(prompt, model, True, temperature)
+        ) as response:
+            response.raise_for_status()
+            pieces = []
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                if chunk.get("response"):
+                    pieces.append(chunk["response"])
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+        if cache_key:
+            await run_blocking(save_llm_response, cache_key, "".join(pieces))
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            yield "Error: The API endpoint was not found. Please check if Ollama is running correctly and the API URL is correct."
+        else:
+            yield f"Error generating text with Ollama: {str(e)}"
+    except httpx.ConnectError as e:
+        yield f"Error: Ollama is not available. Please make sure Ollama is running. Details: {str(e)}"
+    except Exception as e:
+        yield f"Error generating text with Ollama: {str(e)}"
+
+async def run_blocking(func, *args):
+    # Run blocking docx, file or database work in a worker thread so the Gradio event loop stays free
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args))
+
+# Job descriptions shorter than this are almost always accidental submissions; the LLM isn't called for them
+MIN_JOB_DESCRIPTION_LENGTH = 50
+SHORT_JOB_DESCRIPTION_MESSAGE = (
+    f"The job description is too short (under {MIN_JOB_DESCRIPTION_LENGTH} characters). "
+    "Please paste the full job description."
+)
+
+def is_job_description_too_short(job_description):
+    return len(job_description.strip()) < MIN_JOB_DESCRIPTION_LENGTH
+
+# Document processing functions
+def save_custom_resume(base_resume_path, tailoring_suggestions, output_path=None):
+    # Load the base resume
+    doc = Document(base_resume_path)
+    
+    # Add tailoring suggestions at the end
+    # Check if the style exists in the document
+    try:
+        doc.add_heading("Tailoring Suggestions", level=1)
+    except KeyError:
+        # If the style doesn't exist, use a paragraph with manual formatting
+        p = doc.add_paragraph("Tailoring Suggestions")
+        p.runs[0].bold = True
+        p.runs[0].font.size = Pt(16)  # Approximate size for Heading 1
+    
+    doc.add_paragraph(tailoring_suggestions)
+    
+    # Save the customized resume
+    if not output_path:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = os.path.join(RESUME_FOLDER, f"custom_resume_{timestamp}.docx")
+    
+    doc.save(output_path)
+    return output_path
+
+# Prompts put their fixed instructions first and the per-job fields last: Ollama keeps the
+# evaluated prompt of the previous request, so a shared prefix is not processed again.
+# They are dedented once here rather than sending the source indentation with every prompt
+RESUME_PROMPT_TEMPLATE = textwrap.dedent("""
+    I need to customize my resume for the job description at the end of this message.
+    
+    Please analyze the job description and provide specific suggestions on how I should tailor my resume.
+    Focus on:
+    1. Skills to emphasize
+    2. Experience to highlight
+    3. Achievements that would be most relevant
+    4. Keywords to include
+    
+    Format your response as specific, actionable bullet points I can use to modify my resume.
+    
+    Job Description:
+    {job_description}
+    """)
+
+def build_resume_prompt(job_description):
+    return RESUME_PROMPT_TEMPLATE.format(job_description=job_description)
+
+async def create_custom_resume(base_resume_path, job_description, output_path=None):
+    # Generate tailored content using Ollama (at temperature 0, so a repeat for the same
+    # job description is answered from the response cache)
+    tailoring_suggestions = await generate_text_with_ollama(build_resume_prompt(job_description), temperature=0)
+    
+    output_path = await run_blocking(save_custom_resume, base_resume_path, tailoring_suggestions, output_path)
+    return output_path, tailoring_suggestions
+
+# Element tags for paragraphs and text runs in document.xml
+_W_P = qn('w:p')
+_W_T = qn('w:t')
+
+# Each upload is saved under a new name, so parsed text is keyed by the file's
+# content: the same resume uploaded on two tabs is only parsed once
+RESUME_TEXT_CACHE_SIZE = 16
+_resume_texts = OrderedDict()
+_resume_texts_lock = threading.Lock()
+
+# Content digest of a file, recomputed only when its stat values change
+@functools.lru_cache(maxsize=64)
+def _file_digest(path, mtime_ns, size):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _parse_resume_text(resume_path):
+    doc = Document(resume_path)
+    # Walk the XML directly (the same top-level paragraphs as doc.paragraphs) instead of
+    # building python-docx Paragraph and Run objects for every piece of text
+    texts = ("".join(t.text or "" for t in p.iter(_W_T)) for p in doc.element.body.iterchildren(_W_P))
+    return "\n".join(text for text in texts if text.strip())
+
+def read_resume_text(resume_path):
+    st = os.stat(resume_path)
+    digest = _file_digest(resume_path, st.st_mtime_ns, st.st_size)
+    
+    with _resume_texts_lock:
+        text = _resume_texts.get(digest)
+        if text is not None:
+            _resume_texts.move_to_end(digest)
+            return text
+    
+    text = _parse_resume_text(resume_path)
+    with _resume_texts_lock:
+        _resume_texts[digest] = text
+        if len(_resume_texts) > RESUME_TEXT_CACHE_SIZE:
+            _resume_texts.popitem(last=False)
+    return text
+
+def append_plain_paragraphs(doc, texts):
+    # Build the <w:p><w:r><w:t> elements directly for fixed single-line text: doc.add_paragraph
+    # creates proxy objects and searches the body for sectPr again on every call
+    body = doc.element.body
+    sect_pr = body.find(qn('w:sectPr'))
+    for text in texts:
+        if '\n' in text or '\t' in text:
+            # Line breaks and tabs need python-docx's <w:br/>/<w:tab/> handling
+            doc.add_paragraph(text)
+            continue
+        paragraph = OxmlElement('w:p')
+        if text:
+            run = OxmlElement('w:r')
+            text_element = OxmlElement('w:t')
+            text_element.text = text
+            if text != text.strip():
+                text_element.set(qn('xml:space'), 'preserve')
+            run.append(text_element)
+            paragraph.append(run)
+        if sect_pr is not None:
+            sect_pr.addprevious(paragraph)
+        else:
+            body.append(paragraph)
+
+def save_cover_letter(cover_letter_text, company_name, output_path=None):
+    # Get user information
+    user_info = get_user_information()
+    
+    # Create a new document
+    doc = Document(io.BytesIO(BLANK_DOCUMENT_BYTES))
+    
+    # Add user information at the top if available
+    if user_info["full_name"]:
+        header = [user_info["full_name"]]
+        header.extend(value for value in (user_info["address"], user_info["phone"], user_info["email"]) if value)
+    else:
+        header = ["Your Name", "Your Address", "Your Phone", "Your Email"]
+    
+    # Add date, company info and greeting
+    append_plain_paragraphs(doc, header + [
+        datetime.datetime.now().strftime("%B %d, %Y"),
+        "",
+        "Hiring Manager",
+        f"{company_name}",
+        "Company Address",
+        "City, State ZIP",
+        "",
+        "Dear Hiring Manager,",
+    ])
+    
+    # Add cover letter content (add_paragraph turns line breaks inside a paragraph into <w:br/>)
+    paragraphs = cover_letter_text.split('\n\n')
+    for para in paragraphs:
+        if para.strip():
+            doc.add_paragraph(para.strip())
+    
+    # Add closing
+    append_plain_paragraphs(doc, [
+        "",
+        "Sincerely,",
+        "",
+        user_info["full_name"] if user_info["full_name"] else "Your Name",
+    ])
+    
+    # Save the cover letter
+    if not output_path:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = os.path.join(COVER_LETTER_FOLDER, f"cover_letter_{timestamp}.docx")
+    
+    doc.save(output_path)
+    return output_path
+
+# The resume comes before the job fields, so letters for different jobs share it as prefix too
+COVER_LETTER_PROMPT_TEMPLATE = textwrap.dedent("""
+    Write a professional cover letter for the position and company given at the end of this message.
+    
+    The cover letter should:
+    1. Be professionally formatted
+    2. Highlight relevant skills and experience from my resume that match the job requirements
+    3. Show enthusiasm for the role and company
+    4. Include a strong opening and closing
+    5. Be approximately 300-400 words
+    6. Only mention skills and experience that are actually in my resume
+    7. Specifically mention the company name and position
+    8. Reference specific requirements or qualifications from the job description
+    
+    Write the complete cover letter text, ready to be used.
+    
+    My Resume:
+    {resume_text}
+    
+    Position: {position}
+    Company: {company_name}
+    
+    Job Description:
+    {job_description}
+    """)
+
+def build_cover_letter_prompt(job_description, company_name, position, resume_text):
+    return COVER_LETTER_PROMPT_TEMPLATE.format(
+        job_description=job_description,
+        company_name=company_name,
+        position=position,
+        resume_text=resume_text
+    )
+
+async def generate_cover_letter(job_description, company_name, position, resume_path, output_path=None):
+    # Extract resume content
+    resume_text = await run_blocking(read_resume_text, resume_path)
+    
+    # Generate cover letter using Ollama
+    prompt = build_cover_letter_prompt(job_description, company_name, position, resume_text)
+    cover_letter_text = await generate_text_with_ollama(prompt)
+    
+    output_path = await run_blocking(save_cover_letter, cover_letter_text, company_name, output_path)
+    return output_path, cover_letter_text
+
+# Markers that separate the two answers of the combined prompt
+SUGGESTIONS_MARKER = "[1] Tailoring Suggestions:"
+COVER_LETTER_MARKER = "[2] Cover Letter:"
+
+# One prompt for both documents, so the job description and resume are only processed once
+COMBINED_PROMPT_TEMPLATE = textwrap.dedent("""
+    I am applying for the position and company given at the end of this message.
+    Complete both tasks below.
+    
+    Task 1: Give specific, actionable bullet points on how I should tailor my resume to this job.
+    Focus on skills to emphasize, experience to highlight, the most relevant achievements and keywords to include.
+    
+    Task 2: Write a professional cover letter for the position that:
+    1. Highlights relevant skills and experience from my resume that match the job requirements
+    2. Shows enthusiasm for the role and company
+    3. Includes a strong opening and closing
+    4. Is approximately 300-400 words
+    5. Only mentions skills and experience that are actually in my resume
+    6. Specifically mentions the company name and position
+    7. References specific requirements or qualifications from the job description
+    
+    Answer in exactly this format:
+    {suggestions_marker}
+    <the tailoring suggestions>
+    {cover_letter_marker}
+    <the complete cover letter text, ready to be used>
+    
+    My Resume:
+    {resume_text}
+    
+    Position: {position}
+    Company: {company_name}
+    
+    Job Description:
+    {job_description}
+    """)
+
+def build_combined_prompt(job_description, company_name, position, resume_text):
+    return COMBINED_PROMPT_TEMPLATE.format(
+        job_description=job_description,
+        company_name=company_name,
+        position=position,
+        resume_text=resume_text,
+        suggestions_marker=SUGGESTIONS_MARKER,
+        cover_letter_marker=COVER_LETTER_MARKER
+    )
+
+def split_combined_response(response):
+    # Returns None if the model did not follow the format (or Ollama returned an error)
+    suggestions, marker, cover_letter_text = response.partition(COVER_LETTER_MARKER)
+    if not marker or SUGGESTIONS_MARKER not in suggestions:
+        return None
+    
+    suggestions = suggestions.split(SUGGESTIONS_MARKER, 1)[1].strip()
+    return suggestions, cover_letter_text.strip()
+
+async def generate_resume_and_cover_letter(job_description, company_name, position, resume_text):
+    prompt = build_combined_prompt(job_description, company_name, position, resume_text)
+    return split_combined_response(await generate_text_with_ollama(prompt))
+
+async def create_application_documents(base_resume_path, job_description, company_name, position):
+    resume_text = await run_blocking(read_resume_text, base_resume_path)
+    result = await generate_resume_and_cover_letter(job_description, company_name, position, resume_text)
+    return await save_application_documents(base_resume_path, job_description, company_name, position, result)
+
+# Writes both documents from a split combined answer (result), or generates them
+# separately when the combined answer could not be used (result is None)
+async def save_application_documents(base_resume_path, job_description, company_name, position, result):
+    if result is None:
+        # Fall back to one prompt per document; both are independent, so send them together
+        return await asyncio.gather(
+            create_custom_resume(base_resume_path, job_description),
+            generate_cover_letter(job_description, company_name, position, base_resume_path)
+        )
+    
+    suggestions, cover_letter_text = result
+    resume_output, cover_letter_output = await asyncio.gather(
+        run_blocking(save_custom_resume, base_resume_path, suggestions),
+        run_blocking(save_cover_letter, cover_letter_text, company_name)
+    )
+    return (resume_output, suggestions), (cover_letter_output, cover_letter_text)
+
+def _now_sql():
+    # Same "YYYY-MM-DD HH:MM:SS" text as strftime, without the format-string parsing
+    return datetime.datetime.now().isoformat(sep=' ', timespec='seconds')
+
+# User information operations
+# The single user_information row, loaded on first use and reset by save_user_information
+_user_info_cache = None
+
+def save_user_information(full_name, address, phone, email):
+    now = _now_sql()
+    
+    with db_transaction() as cursor:
+        # Check if user information already exists
+        cursor.execute('SELECT COUNT(*) FROM user_information')
+        count = cursor.fetchone()[0]
+        
+        if count > 0:
+            # Update existing record
+            cursor.execute('''
+            UPDATE user_information
+            SET full_name = ?, address = ?, phone = ?, email = ?, updated_at = ?
+            WHERE id = 1
+            ''', (full_name, address, phone, email, now))
+        else:
+            # Insert new record
+            cursor.execute('''
+            INSERT INTO user_information (
+                full_name, address, phone, email, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            ''', (full_name, address, phone, email, now, now))
+    
+    # Reset after the commit so the next read picks up the saved values
+    global _user_info_cache
+    _user_info_cache = None
+    return True
+
+def get_user_information():
+    global _user_info_cache
+    if _user_info_cache is not None:
+        return _user_info_cache
+    
+    with db_cursor() as cursor:
+        cursor.execute('SELECT * FROM user_information LIMIT 1')
+        row = cursor.fetchone()
+    
+    # sqlite3.Row already supports access by column name, no dict copy needed
+    _user_info_cache = row if row else {"full_name": "", "address": "", "phone": "", "email": ""}
+    return _user_info_cache
+
+# Database operations
+# Job application columns set by the app (created_at/updated_at are added on write)
+JOB_APPLICATION_FIELDS = (
+    'company_name', 'position', 'date_applied', 'job_description', 'status',
+    'salary_info', 'contact_info', 'application_url', 'notes',
+    'resume_path', 'cover_letter_path'
+)
+INSERT_JOB_APPLICATION_SQL = (
+    f'INSERT INTO job_applications ({", ".join(JOB_APPLICATION_FIELDS)}, created_at, updated_at) '
+    f'VALUES ({", ".join("?" for _ in JOB_APPLICATION_FIELDS)}, ?, ?)'
+)
+
+# Bumped by every write to job_applications, inside its transaction: readers share the
+# connection's lock, so none can read the new version before the write has committed
+_job_applications_version = 0
+
+def _bump_job_applications_version():
+    global _job_applications_version
+    _job_applications_version += 1
+
+def add_job_application(company_name, position, date_applied, job_description, status, 
+                       salary_info=None, contact_info=None, application_url=None, notes=None,
+                       resume_path=None, cover_letter_path=None):
+    now = _now_sql()
+    
+    with db_transaction() as cursor:
+        cursor.execute(INSERT_JOB_APPLICATION_SQL, (
+            company_name, position, date_applied, job_description, status,
+            salary_info, contact_info, application_url, notes,
+            resume_path, cover_letter_path, now, now
+        ))
+        
+        job_id = cursor.lastrowid
+        _bump_job_applications_version()
+    
+    return job_id
+
+def add_job_applications_bulk(rows):
+    # rows: tuples in JOB_APPLICATION_FIELDS order; one prepared statement and one commit for all of them
+    now = _now_sql()
+    
+    with db_transaction() as cursor:
+        cursor.executemany(INSERT_JOB_APPLICATION_SQL, [(*row, now, now) for row in rows])
+        count = cursor.rowcount
+        _bump_job_applications_version()
+    
+    return count
+
+# One fixed UPDATE covers every combination of fields, so SQLite prepares it once
+# (COALESCE keeps the current value for columns passed as None)
+UPDATE_JOB_APPLICATION_SQL = (
+    'UPDATE job_applications SET '
+    + ', '.join(f'{column} = COALESCE(?, {column})' for column in JOB_APPLICATION_FIELDS)
+    + ', updated_at = ? WHERE id = ?'
+)
+
+def update_job_application(job_id, **kwargs):
+    unknown = set(kwargs) - set(JOB_APPLICATION_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown job application fields: {', '.join(sorted(unknown))}")
+    
+    # Every column is bound; the ones not being updated are None
+    values = [kwargs.get(column) for column in JOB_APPLICATION_FIELDS]
+    values.append(_now_sql())  # updated_at
+    values.append(job_id)  # For the WHERE clause
+    
+    with db_transaction() as cursor:
+        cursor.execute(UPDATE_JOB_APPLICATION_SQL, values)
+        _bump_job_applications_version()
+
+def get_all_job_applications():
+    with db_cursor() as cursor:
+        cursor.execute('SELECT * FROM job_applications ORDER BY date_applied DESC')
+        # sqlite3.Row supports access by index and by column name
+        return cursor.fetchall()
+
+# Columns shown in the applications table
+APPLICATION_LIST_COLUMNS = ['id', 'company_name', 'position', 'date_applied', 'status']
+
+# Hot read queries, built once: the connection's statement cache is keyed on the exact SQL text
+SELECT_APPLICATION_SUMMARIES_SQL = (
+    f'SELECT {", ".join(APPLICATION_LIST_COLUMNS)} FROM job_applications ORDER BY date_applied DESC'
+)
+SELECT_JOB_APPLICATION_SQL = 'SELECT * FROM job_applications WHERE id = ?'
+
+def list_job_applications_summary():
+    # Only the table's columns, as plain tuples (no description/notes text, no dict per row)
+    with db_cursor() as cursor:
+        cursor.row_factory = None
+        cursor.execute(SELECT_APPLICATION_SUMMARIES_SQL)
+        return cursor.fetchall()
+
+# Rows are cached by job ID and write version (the UI loads the same job again and again).
+# A read that raced a write can only store its row under the version it started with,
+# which no later read asks for, so a stale row is never served after the write commits
+@functools.lru_cache(maxsize=128)
+def _fetch_job_application(job_id, version):
+    with db_cursor() as cursor:
+        cursor.execute(SELECT_JOB_APPLICATION_SQL, (job_id,))
+        return cursor.fetchone()
+
+def get_job_application(job_id):
+    return _fetch_job_application(job_id, _job_applications_version)
+
+# SQLite builds before 3.32 allow at most 999 bound parameters per statement
+MAX_IDS_PER_QUERY = 500
+
+# Several applications in one query per MAX_IDS_PER_QUERY ids instead of one per id:
+# returns {job_id: row}, without the IDs that don't exist
+def get_job_applications(job_ids):
+    job_ids = list(job_ids)
+    applications = {}
+    with db_cursor() as cursor:
+        for start in range(0, len(job_ids), MAX_IDS_PER_QUERY):
+            batch = job_ids[start:start + MAX_IDS_PER_QUERY]
+            placeholders = ", ".join("?" * len(batch))
+            cursor.execute(f'SELECT * FROM job_applications WHERE id IN ({placeholders})', batch)
+            applications.update((row["id"], row) for row in cursor)
+    return applications
+
+# Shared by every "Load" button: returns (error message, application), which is what
+# the session's gr.State is set to next. Always looked up (a repeat is a cache hit),
+# so edits made in another tab or session are picked up
+def load_job(job_id):
+    if not job_id:
+        return "Please enter a valid Job ID", None
+    
+    job_id = int(job_id)
+    application = get_job_application(job_id)
+    if not application:
+        return "Job application not found", None
+    return None, dict(application)
+
+# DELETE ... RETURNING needs SQLite 3.35+
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+def delete_job_application(job_id):
+    with db_transaction() as cursor:
+        if SQLITE_HAS_RETURNING:
+            # Delete and get the file paths in one statement
+            cursor.execute(
+                'DELETE FROM job_applications WHERE id = ? RETURNING resume_path, cover_letter_path',
+                (job_id,)
+            )
+            rows = cursor.fetchall()
+            row = rows[0] if rows else None
+        else:
+            # Get file paths before deletion
+            cursor.execute('SELECT resume_path, cover_letter_path FROM job_applications WHERE id = ?', (job_id,))
+            row = cursor.fetchone()
+            
+            # Delete from database
+            cursor.execute('DELETE FROM job_applications WHERE id = ?', (job_id,))
+        
+        _bump_job_applications_version()
+    
+    # Delete associated files if they exist (one unlink each, no separate exists() check)
+    if row:
+        for path in row:
+            if path:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+    
+    return True
+
+# LLM response cache operations
+def get_cached_llm_response(key, max_age_seconds):
+    cutoff = (datetime.datetime.now() - datetime.timedelta(seconds=max_age_seconds)).isoformat(sep=' ', timespec='seconds')
+    with db_cursor() as cursor:
+        cursor.execute('SELECT response FROM llm_cache WHERE key = ? AND created_at >= ?', (key, cutoff))
+        row = cursor.fetchone()
+    return row["response"] if row else None
+
+def save_llm_response(key, response):
+    with db_transaction() as cursor:
+        cursor.execute(
+            'INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)',
+            (key, response, _now_sql())
+        )
+
+# CSS for custom styling
+CUSTOM_CSS = """
+.gradio-container {
+    max-width: 1200px !important;
+}
+
+h1 {
+    text-align: center;
+    margin-bottom: 1.5rem;
+    color: #4f46e5;
+    font-weight: 700;
+    font-size: 2.5rem;
+}
+
+.app-header {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    margin-bottom: 1rem;
+    gap: 0.5rem;
+}
+
+.app-header svg {
+    width: 32px;
+    height: 32px;
+}
+
+.tab-header {
+    font-size: 1.25rem;
+    font-weight: 600;
+    margin-bottom: 1rem;
+    color: #4f46e5;
+    border-bottom: 2px solid #e5e7eb;
+    padding-bottom: 0.5rem;
+}
+
+.info-box {
+    background-color: #f0f9ff;
+    border-left: 4px solid #3b82f6;
+    padding: 1rem;
+    margin-bottom: 1rem;
+    border-radius: 0.375rem;
+}
+
+.success-message {
+    color: #047857;
+    font-weight: 500;
+}
+
+.error-message {
+    color: #b91c1c;
+    font-weight: 500;
+}
+
+.footer {
+    text-align: center;
+    margin-top: 2rem;
+    padding-top: 1rem;
+    border-top: 1px solid #e5e7eb;
+    color: #6b7280;
+    font-size: 0.875rem;
+}
+"""
+
+# Page title shown above the tabs
+APP_HEADER_HTML = """
+<h1>
+    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor">
+        <path d="M4.5 6.375a4.125 4.125 0 118.25 0 4.125 4.125 0 01-8.25 0zM14.25 8.625a3.375 3.375 0 116.75 0 3.375 3.375 0 01-6.75 0zM1.5 19.125a7.125 7.125 0 0114.25 0v.003l-.001.119a.75.75 0 01-.363.63 13.067 13.067 0 01-6.761 1.873c-2.472 0-4.786-.684-6.76-1.873a.75.75 0 01-.364-.63l-.001-.122zM17.25 19.128l-.001.144a2.25 2.25 0 01-.233.96 10.088 10.088 0 005.06-1.01.75.75 0 00.42-.643 4.875 4.875 0 00-6.957-4.611 8.586 8.586 0 011.71 5.157v.003z" />
+    </svg>
+    Job Application Tracker
+</h1>
+"""
+
+# Custom Theme
+def create_custom_theme():
+    return gr.themes.Soft(
+        primary_hue="indigo",
+        secondary_hue="blue",
+        neutral_hue="slate",
+        font=["Inter", "ui-sans-serif", "system-ui", "sans-serif"],
+    )
+
+# Gradio UI
+def create_ui():
+    # Initialize the database once per process rather than on every page load
+    setup_database()
+    
+    # Set a custom theme
+    theme = create_custom_theme()
+    
+    # Helper function to refresh applications list
+    def refresh_applications_list():
+        print("Refreshing applications list...")
+        try:
+            applications = list_job_applications_summary()
+            print(f"Retrieved {len(applications)} applications")
+            # gr.DataFrame takes plain rows and labels them with its own headers
+            return [list(application) for application in applications]
+        except Exception as e:
+            print(f"Error in refresh_applications_list: {str(e)}")
+            return []
+    
+    # Helper function to save uploaded resume
+    def save_uploaded_resume(file):
+        print("In save_uploaded_resume function...")
+        if file is None:
+            print("No file provided")
+            return None
+        
+        try:
+            # Create a unique filename
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"base_resume_{timestamp}.docx"
+            filepath = os.path.join(RESUME_FOLDER, filename)
+            
+            print(f"File info: {file}")
+            print(f"Saving to: {filepath}")
+            
+            # Save the uploaded file: a hard link to Gradio's temp file copies no data;
+            # fall back to a real copy when it is on another filesystem
+            try:
+                os.link(file.name, filepath)
+            except OSError:
+                shutil.copyfile(file.name, filepath)
+            print(f"File saved successfully to {filepath}")
+            return filepath
+        except Exception as e:
+            print(f"Error in save_uploaded_resume: {str(e)}")
+            return None
+    
+    # Add Job Application Tab
+    with gr.Blocks(theme=theme, css=CUSTOM_CSS) as app:
+        with gr.Row(elem_classes="app-header"):
+            gr.Markdown(APP_HEADER_HTML)
+        
+        # State variables
+        base_resume_path = gr.State(None)
+        current_job_id = gr.State(None)
+        # Last application loaded by any "Load" button, shared by all tabs
+        current_application = gr.State(None)
+        
+        with gr.Tabs() as tabs:
+            # Tab 1: User Information
+            with gr.TabItem("User Information", id="user-info-tab"):
+                gr.Markdown('<div class="tab-header">Personal Information</div>')
+                
+                gr.Markdown('<div class="info-box">This information will be used in your cover letters and other application documents.</div>')
+                with gr.Row():
+                    with gr.Column():
+                        user_name = gr.Textbox(label="Full Name")
+                        user_address = gr.Textbox(label="Address", lines=3)
+                    
+                    with gr.Column():
+                        user_phone = gr.Textbox(label="Phone Number")
+                        user_email = gr.Textbox(label="Email Address")
+                
+                with gr.Row():
+                    save_user_btn = gr.Button("Save User Information", variant="primary")
+                    load_user_btn = gr.Button("Load Saved Information", variant="secondary")
+                
+                user_info_result = gr.Textbox(label="Result", interactive=False, elem_classes=["result-box"])
+                
+                with gr.Row():
+                    test_ollama_btn = gr.Button("Test Ollama Connection", variant="secondary", size="sm")
+                    ollama_status = gr.Textbox(label="Ollama Status", interactive=False)
+                
+                # Save user information
+                def save_user_info(name, address, phone, email):
+                    if not name or not email:
+                        return "Please provide at least your name and email address"
+                    
+                    try:
+                        save_user_information(name, address, phone, email)
+                        return "User information saved successfully!"
+                    except Exception as e:
+                        return f"Error saving user information: {str(e)}"
+                
+                # Load user information
+                def load_user_info():
+                    user_info = get_user_information()
+                    return (
+                        user_info["full_name"],
+                        user_info["address"],
+                        user_info["phone"],
+                        user_info["email"],
+                        "User information loaded successfully!"
+                    )
+                
+                # Check that Ollama is reachable (on demand only, generation doesn't probe first)
+                async def test_ollama_connection():
+                    available, error = await check_ollama_availability()
+                    if available:
+                        return "Ollama is running"
+                    return f"Ollama is not available. Please make sure Ollama is running. Details: {error}"
+                
+                # Connect event handlers
+                save_user_btn.click(
+                    save_user_info,
+                    inputs=[user_name, user_address, user_phone, user_email],
+                    outputs=[user_info_result]
+                )
+                
+                load_user_btn.click(
+                    load_user_info,
+                    inputs=[],
+                    outputs=[user_name, user_address, user_phone, user_email, user_info_result]
+                )
+                
+                test_ollama_btn.click(
+                    test_ollama_connection,
+                    inputs=[],
+                    outputs=[ollama_status]
+                )
+            
+            # Tab 2: Add New Application
+            with gr.TabItem("Add Application", id="add-app-tab"):
+                gr.Markdown('<div class="tab-header">Add New Job Application</div>')
+                
+                gr.Markdown('<div class="info-box">Track a new job application by filling out the details below.</div>')
+                with gr.Row():
+                    with gr.Column():
+                        company_input = gr.Textbox(label="Company Name")
+                        position_input = gr.Textbox(label="Position")
+                        date_input = gr.Textbox(label="Date Applied", value=datetime.datetime.now().strftime("%Y-%m-%d"))
+                        status_input = gr.Dropdown(
+                            label="Status", 
+                            choices=["Applied", "Interviewing", "Rejected", "Offer", "Accepted", "Declined"],
+                            value="Applied"
+                        )
+                        salary_input = gr.Textbox(label="Salary Information (Optional)")
+                    
+                    with gr.Column():
+                        contact_input = gr.Textbox(label="Contact Information (Optional)")
+                        url_input = gr.Textbox(label="Application URL (Optional)")
+                        job_desc_input = gr.Textbox(label="Job Description", lines=10)
+                        notes_input = gr.Textbox(label="Notes (Optional)", lines=3)
+                
+                with gr.Row():
+                    base_resume_upload = gr.File(label="Upload Base Resume (DOCX)")
+                
+                with gr.Row():
+                    add_btn = gr.Button("Add Job Application", variant="primary")
+                    clear_btn = gr.Button("Clear Form", variant="secondary")
+                
+                result_text = gr.Textbox(label="Result", interactive=False, elem_classes=["result-box"])
+                
+                # Add job application function
+                def add_application(company, position, date, job_desc, status, salary, contact, url, notes, resume_file, resume_path_state):
+                    print("Starting add_application function...")
+                    if not company or not position or not date:
+                        print("Missing required fields")
+                        return "Please fill in all required fields (Company, Position, Date)", resume_path_state
+                    
+                    try:
+                        # Save the base resume if provided
+                        resume_path = None
+                        if resume_file:
+                            print("Saving uploaded resume...")
+                            resume_path = save_uploaded_resume(resume_file)
+                            resume_path_state = resume_path
+                            print(f"Resume saved to {resume_path}")
+                        
+                        # Add to database
+                        print("Adding job application to database...")
+                        job_id = add_job_application(
+                            company, position, date, job_desc, status,
+                            salary, contact, url, notes, resume_path, None
+                        )
+                        print(f"Job application added with ID: {job_id}")
+                        
+                        return f"Job application added successfully! ID: {job_id}", resume_path_state
+                    except Exception as e:
+                        print(f"Error in add_application: {str(e)}")
+                        return f"Error adding job application: {str(e)}", resume_path_state
+                
+                # Clear form function
+                def clear_form():
+                    return "", "", datetime.datetime.now().strftime("%Y-%m-%d"), "", "Applied", "", "", "", "", None
+                
+                # Connect event handlers
+                add_btn.click(
+                    add_application,
+                    inputs=[
+                        company_input, position_input, date_input, job_desc_input, status_input,
+                        salary_input, contact_input, url_input, notes_input, base_resume_upload, base_resume_path
+                    ],
+                    outputs=[result_text, base_resume_path]
+                )
+                
+                clear_btn.click(
+                    clear_form,
+                    inputs=[],
+                    outputs=[
+                        company_input, position_input, date_input, job_desc_input, status_input,
+                        salary_input, contact_input, url_input, notes_input, base_resume_upload
+                    ]
+                )
+            
+            # Tab 3: View/Edit Applications
+            with gr.TabItem("View Applications", id="view-app-tab"):
+                gr.Markdown('<div class="tab-header">Manage Job Applications</div>')
+                
+                gr.Markdown('<div class="info-box">View, edit, or delete your existing job applications.</div>')
+                with gr.Row():
+                    refresh_btn = gr.Button("Refresh List", variant="primary", size="sm")
+                
+                with gr.Row():
+                    import_file = gr.File(label="Import Applications (CSV with a header row using the database column names)")
+                    import_btn = gr.Button("Import CSV", variant="secondary", size="sm")
+                
+                applications_table = gr.DataFrame(
+                    headers=['ID', 'Company', 'Position', 'Date Applied', 'Status'],
+                    datatype=['number', 'str', 'str', 'str', 'str'],
+                    label="Job Applications"
+                )
+                
+                with gr.Row():
+                    selected_id_input = gr.Number(label="Selected Job ID", precision=0)
+                    load_btn = gr.Button("Load Application", variant="primary", size="sm")
+                    delete_btn = gr.Button("Delete Application", variant="stop", size="sm")
+                
+                with gr.Row():
+                    with gr.Column():
+                        edit_company = gr.Textbox(label="Company Name")
+                        edit_position = gr.Textbox(label="Position")
+                        edit_date = gr.Textbox(label="Date Applied")
+                        edit_status = gr.Dropdown(
+                            label="Status", 
+                            choices=["Applied", "Interviewing", "Rejected", "Offer", "Accepted", "Declined"]
+                        )
+                        edit_salary = gr.Textbox(label="Salary Information")
+                    
+                    with gr.Column():
+                        edit_contact = gr.Textbox(label="Contact Information")
+                        edit_url = gr.Textbox(label="Application URL")
+                        edit_job_desc = gr.Textbox(label="Job Description", lines=10)
+                        edit_notes = gr.Textbox(label="Notes", lines=3)
+                
+                with gr.Row():
+                    update_btn = gr.Button("Update Application", variant="primary")
+                
+                edit_result = gr.Textbox(label="Result", interactive=False, elem_classes=["result-box"])
+                
+                # Load applications on refresh
+                def load_applications():
+                    return refresh_applications_list()
+                
+                # Load specific application details
+                def load_application_details(job_id, current):
+                    error, application = load_job(job_id)
+                    if error:
+                        return (error, "", "", "", "", "", "", "", "", "", None, current)
+                    
+                    return (
+                        f"Loaded application {job_id}",
+                        application["company_name"],
+                        application["position"],
+                        application["date_applied"],
+                        application["status"],
+                        application["salary_info"] or "",
+                        application["contact_info"] or "",
+                        application["application_url"] or "",
+                        application["job_description"] or "",
+                        application["notes"] or "",
+                        job_id,
+                        application
+                    )
+                
+                # Update application
+                def update_application(company, position, date, status, salary, contact, url, job_desc, notes, job_id, current):
+                    if not job_id:
+                        return "No application selected", current
+                    
+                    update_job_application(
+                        job_id,
+                        company_name=company,
+                        position=position,
+                        date_applied=date,
+                        status=status,
+                        salary_info=salary,
+                        contact_info=contact,
+                        application_url=url,
+                        job_description=job_desc,
+                        notes=notes
+                    )
+                    
+                    # Drop the loaded copy so the other tabs read the new values
+                    return f"Application {job_id} updated successfully", None
+                
+                # Import applications from a CSV file in one transaction
+                def import_applications(csv_file):
+                    if csv_file is None:
+                        return "Please upload a CSV file", refresh_applications_list()
+                    
+                    try:
+                        with open(csv_file.name, newline='', encoding='utf-8-sig') as f:
+                            records = list(csv.DictReader(f))
+                        
+                        missing = [
+                            index for index, record in enumerate(records, start=2)
+                            if not record.get('company_name') or not record.get('position') or not record.get('date_applied')
+                        ]
+                        if missing:
+                            return f"Rows missing company_name, position or date_applied: {missing}", refresh_applications_list()
+                        
+                        rows = [
+                            tuple(
+                                (record.get(field) or 'Applied') if field == 'status' else (record.get(field) or None)
+                                for field in JOB_APPLICATION_FIELDS
+                            )
+                            for record in records
+                        ]
+                        count = add_job_applications_bulk(rows)
+                        return f"Imported {count} applications", refresh_applications_list()
+                    except Exception as e:
+                        return f"Error importing applications: {str(e)}", refresh_applications_list()
+                
+                # Delete application
+                def delete_application(job_id, current):
+                    if not job_id:
+                        return "Please enter a valid Job ID", None, current
+                    
+                    success = delete_job_application(int(job_id))
+                    if success:
+                        return f"Application {job_id} deleted successfully", None, None
+                    else:
+                        return f"Failed to delete application {job_id}", job_id, current
+                
+                # Connect event handlers
+                refresh_btn.click(
+                    load_applications,
+                    inputs=[],
+                    outputs=[applications_table]
+                )
+                
+                import_btn.click(
+                    import_applications,
+                    inputs=[import_file],
+                    outputs=[edit_result, applications_table]
+                )
+                
+                load_btn.click(
+                    load_application_details,
+                    inputs=[selected_id_input, current_application],
+                    outputs=[
+                        edit_result, edit_company, edit_position, edit_date, edit_status,
+                        edit_salary, edit_contact, edit_url, edit_job_desc, edit_notes, current_job_id,
+                        current_application
+                    ]
+                )
+                
+                update_btn.click(
+                    update_application,
+                    inputs=[
+                        edit_company, edit_position, edit_date, edit_status, edit_salary,
+                        edit_contact, edit_url, edit_job_desc, edit_notes, current_job_id, current_application
+                    ],
+                    outputs=[edit_result, current_application]
+                )
+                
+                delete_btn.click(
+                    delete_application,
+                    inputs=[selected_id_input, current_application],
+                    outputs=[edit_result, current_job_id, current_application]
+                )
+            
+            # Tab 4: Resume Customization
+            with gr.TabItem("Customize Resume", id="resume-tab"):
+                gr.Markdown('<div class="tab-header">Resume Customization</div>')
+                
+                gr.Markdown('<div class="info-box">Tailor your resume to match the job description using AI assistance.</div>')
+                with gr.Row():
+                    with gr.Column():
+                        resume_job_id = gr.Number(label="Job ID (Optional)", precision=0)
+                        load_job_btn = gr.Button("Load Job Details", variant="primary", size="sm")
+                    
+                    with gr.Column():
+                        resume_upload = gr.File(label="Upload Resume (DOCX)")
+                
+                resume_job_company = gr.Textbox(label="Company Name", interactive=False)
+                resume_job_position = gr.Textbox(label="Position", interactive=False)
+                resume_job_desc = gr.Textbox(label="Job Description", lines=10)
+                
+                customize_btn = gr.Button("Customize Resume", variant="primary")
+                
+                with gr.Row():
+                    resume_result = gr.Textbox(label="Customization Result", interactive=False)
+                    resume_download = gr.File(label="Download Customized Resume")
+                
+                # Load job details for resume customization
+                def load_job_for_resume(job_id, resume_path_state, current):
+                    error, application = load_job(job_id)
+                    if error:
+                        return error, "", "", "", resume_path_state, current
+                    
+                    return (
+                        f"Loaded job details for {application['company_name']}",
+                        application["company_name"],
+                        application["position"],
+                        application["job_description"] or "",
+                        resume_path_state,
+                        application
+                    )
+                
+                # Customize resume
+                async def customize_resume(job_desc, resume_file, resume_path_state):
+                    if not job_desc:
+                        yield "Please provide a job description", None, resume_path_state
+                        return
+                    if is_job_description_too_short(job_desc):
+                        yield SHORT_JOB_DESCRIPTION_MESSAGE, None, resume_path_state
+                        return
+                    
+                    # Determine which resume to use
+                    resume_path = None
+                    if resume_file:
+                        resume_path = await run_blocking(save_uploaded_resume, resume_file)
+                    elif resume_path_state:
+                        resume_path = resume_path_state
+                    else:
+                        yield "Please upload a resume", None, resume_path_state
+                        return
+                    
+                    # Show the suggestions as they are generated
+                    suggestions = ""
+                    async for chunk in stream_text_with_ollama(build_resume_prompt(job_desc), temperature=0):
+                        suggestions += chunk
+                        yield f"Generating suggestions...\n\n{suggestions}", None, resume_path_state
+                    
+                    # Create customized resume
+                    output_path = await run_blocking(save_custom_resume, resume_path, suggestions)
+                    
+                    yield f"Resume customized successfully!\n\nSuggestions:\n{suggestions}", output_path, resume_path_state
+                
+                # Connect event handlers
+                load_job_btn.click(
+                    load_job_for_resume,
+                    inputs=[resume_job_id, base_resume_path, current_application],
+                    outputs=[
+                        resume_result, resume_job_company, resume_job_position, resume_job_desc, base_resume_path,
+                        current_application
+                    ]
+                )
+                
+                customize_btn.click(
+                    customize_resume,
+                    inputs=[resume_job_desc, resume_upload, base_resume_path],
+                    outputs=[resume_result, resume_download, base_resume_path]
+                )
+            
+            # Tab 5: Cover Letter Generation
+            with gr.TabItem("Generate Cover Letter", id="cover-letter-tab"):
+                gr.Markdown('<div class="tab-header">Cover Letter Generation</div>')
+                
+                gr.Markdown('<div class="info-box">Generate a professional cover letter tailored to the job description using AI.</div>')
+                with gr.Row():
+                    with gr.Column():
+                        cl_job_id = gr.Number(label="Job ID (Optional)", precision=0)
+                        cl_load_job_btn = gr.Button("Load Job Details", variant="primary", size="sm")
+                    
+                    with gr.Column():
+                        cl_resume_upload = gr.File(label="Upload Resume (DOCX) *Required*")
+                
+                cl_company = gr.Textbox(label="Company Name")
+                cl_position = gr.Textbox(label="Position")
+                cl_job_desc = gr.Textbox(label="Job Description", lines=10)
+                cl_resume_path = gr.State(None)  # Hidden state to store resume path
+                
+                with gr.Row():
+                    generate_cl_btn = gr.Button("Generate Cover Letter", variant="primary")
+                    generate_both_btn = gr.Button("Generate Cover Letter + Custom Resume", variant="secondary")
+                
+                with gr.Row():
+                    cl_result = gr.Textbox(label="Generated Cover Letter Preview", lines=10, interactive=False)
+                    cl_download = gr.File(label="Download Cover Letter")
+                    cl_resume_download = gr.File(label="Download Customized Resume")
+                
+                # Load job details for cover letter
+                def load_job_for_cl(job_id, current):
+                    error, application = load_job(job_id)
+                    if error:
+                        return error, "", "", "", None, current
+                    
+                    # Get resume path if available
+                    resume_path = application["resume_path"]
+                    resume_message = ""
+                    if resume_path and os.path.exists(resume_path):
+                        resume_message = f" (Resume found: {os.path.basename(resume_path)})"
+                    else:
+                        resume_path = None
+                        resume_message = " (No resume found, please upload one)"
+                    
+                    return (
+                        f"Loaded job details for {application['company_name']}{resume_message}",
+                        application["company_name"],
+                        application["position"],
+                        application["job_description"] or "",
+                        resume_path,
+                        application
+                    )
+                
+                # Generate cover letter
+                async def generate_cover_letter_handler(company, position, job_desc, resume_file, resume_path_state):
+                    if not company or not position or not job_desc:
+                        yield "Please fill in all fields", None, resume_path_state
+                        return
+                    if is_job_description_too_short(job_desc):
+                        yield SHORT_JOB_DESCRIPTION_MESSAGE, None, resume_path_state
+                        return
+                    
+                    # Determine which resume to use
+                    resume_path = None
+                    if resume_file:
+                        resume_path = await run_blocking(save_uploaded_resume, resume_file)
+                        resume_path_state = resume_path
+                    elif resume_path_state:
+                        resume_path = resume_path_state
+                    else:
+                        yield "Please upload a resume or load a job with an existing resume", None, resume_path_state
+                        return
+                    
+                    # Show the letter in the preview as it is generated
+                    resume_text = await run_blocking(read_resume_text, resume_path)
+                    prompt = build_cover_letter_prompt(job_desc, company, position, resume_text)
+                    cover_letter_text = ""
+                    async for chunk in stream_text_with_ollama(prompt):
+                        cover_letter_text += chunk
+                        yield cover_letter_text, None, resume_path_state
+                    
+                    output_path = await run_blocking(save_cover_letter, cover_letter_text, company)
+                    
+                    yield cover_letter_text, output_path, resume_path_state
+                
+                # Generate the customized resume and the cover letter together
+                async def generate_both_handler(company, position, job_desc, resume_file, resume_path_state):
+                    if not company or not position or not job_desc:
+                        yield "Please fill in all fields", None, None, resume_path_state
+                        return
+                    if is_job_description_too_short(job_desc):
+                        yield SHORT_JOB_DESCRIPTION_MESSAGE, None, None, resume_path_state
+                        return
+                    
+                    # Determine which resume to use
+                    resume_path = None
+                    if resume_file:
+                        resume_path = await run_blocking(save_uploaded_resume, resume_file)
+                        resume_path_state = resume_path
+                    elif resume_path_state:
+                        resume_path = resume_path_state
+                    else:
+                        yield "Please upload a resume or load a job with an existing resume", None, None, resume_path_state
+                        return
+                    
+                    # Show the combined answer as it is generated
+                    resume_text = await run_blocking(read_resume_text, resume_path)
+                    prompt = build_combined_prompt(job_desc, company, position, resume_text)
+                    response = ""
+                    async for chunk in stream_text_with_ollama(prompt):
+                        response += chunk
+                        yield f"Generating...\n\n{response}", None, None, resume_path_state
+                    
+                    result = split_combined_response(response)
+                    if result is None:
+                        yield "Generating the cover letter and resume separately...", None, None, resume_path_state
+                    (resume_output, _), (output_path, cover_letter_text) = await save_application_documents(
+                        resume_path, job_desc, company, position, result
+                    )
+                    
+                    yield cover_letter_text, output_path, resume_output, resume_path_state
+                
+                # Connect event handlers
+                cl_load_job_btn.click(
+                    load_job_for_cl,
+                    inputs=[cl_job_id, current_application],
+                    outputs=[cl_result, cl_company, cl_position, cl_job_desc, cl_resume_path, current_application]
+                )
+                
+                generate_cl_btn.click(
+                    generate_cover_letter_handler,
+                    inputs=[cl_company, cl_position, cl_job_desc, cl_resume_upload, cl_resume_path],
+                    outputs=[cl_result, cl_download, cl_resume_path]
+                )
+                
+                generate_both_btn.click(
+                    generate_both_handler,
+                    inputs=[cl_company, cl_position, cl_job_desc, cl_resume_upload, cl_resume_path],
+                    outputs=[cl_result, cl_download, cl_resume_download, cl_resume_path]
+                )
+        
+        # Footer
+        gr.Markdown('<div class="footer">Job Application Tracker - Helping you organize your job search</div>')
+    
+    return app
+
+# Main function
+def main():
+    app = create_ui()
+    app.launch(
+        share=False,
+    )
+
+if __name__ == "__main__":
+    main()
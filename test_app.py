@@ -1,69 +1,190 @@
-import sqlite3
-import os
-import datetime
-from main import add_job_application, get_job_application, update_job_application, delete_job_application
-
-def test_database_operations():
-    print("Testing database operations...")
-    
-    # Ensure the database exists
-    if not os.path.exists("job_applications.db"):
-        print("Database not found. Please run the main application first.")
-        return False
-    
-    # Test adding a job application
-    print("\n1. Adding a sample job application...")
-    job_id = add_job_application(
-        company_name="Test Company",
-        position="Software Developer",
-        date_applied=datetime.datetime.now().strftime("%Y-%m-%d"),
-        job_description="This is a test job description for a software developer position.",
-        status="Applied",
-        salary_info="$100,000 - $120,000",
-        contact_info="recruiter@testcompany.com",
-        application_url="https://testcompany.com/careers",
-        notes="This is a test note."
-    )
-    print(f"Job application added with ID: {job_id}")
-    
-    # Test retrieving a job application
-    print("\n2. Retrieving the job application...")
-    job = get_job_application(job_id)
-    if job:
-        print(f"Retrieved job application: {job['company_name']} - {job['position']}")
-        print(f"Status: {job['status']}")
-    else:
-        print("Failed to retrieve job application.")
-        return False
-    
-    # Test updating a job application
-    print("\n3. Updating the job application status...")
-    update_job_application(job_id, status="Interviewing")
-    job = get_job_application(job_id)
-    if job and job['status'] == "Interviewing":
-        print(f"Updated job application status to: {job['status']}")
-    else:
-        print("Failed to update job application status.")
-        return False
-    
-    # Test deleting a job application
-    print("\n4. Deleting the job application...")
-    success = delete_job_application(job_id)
-    if success:
-        print(f"Deleted job application with ID: {job_id}")
-        # Verify deletion
-        job = get_job_application(job_id)
-        if job is None:
-            print("Verified job application was deleted.")
-        else:
-            print("Failed to verify job application deletion.")
-            return False
-    else:
-        print("Failed to delete job application.")
-        return False
-    
-    print("\nAll database operations completed successfully!")
-    return True
-
-if __name__ == "__main__":
-    test_database_operations()
+import asyncio
+import datetime
+from contextlib import contextmanager
+import httpx
+import pytest
+from docx import Document
+import main
+from main import (
+    JOB_APPLICATION_FIELDS, add_job_application, add_job_applications_bulk, db_transaction,
+    get_job_application, get_job_applications, list_job_applications_summary,
+    update_job_application, delete_job_application
+)
+
+# Computed once per test run
+TODAY = datetime.date.today().isoformat()
+
+SAMPLE_APPLICATION = dict(
+    company_name="Test Company",
+    position="Software Developer",
+    job_description="This is a test job description for a software developer position.",
+    status="Applied",
+    salary_info="$100,000 - $120,000",
+    contact_info="recruiter@testcompany.com",
+    application_url="https://testcompany.com/careers",
+    notes="This is a test note."
+)
+
+# SAMPLE_APPLICATION as a tuple in JOB_APPLICATION_FIELDS order, for add_job_applications_bulk
+def application_row(**overrides):
+    values = dict(SAMPLE_APPLICATION, date_applied="2024-01-01", **overrides)
+    return tuple(values.get(field) for field in JOB_APPLICATION_FIELDS)
+
+# An application inserted into the test database
+@pytest.fixture
+def job(db):
+    return add_job_application(
+        date_applied=TODAY,
+        **SAMPLE_APPLICATION
+    )
+
+def test_add(job):
+    assert isinstance(job, int)
+
+def test_get(job):
+    application = get_job_application(job)
+    
+    assert application is not None
+    for field, value in SAMPLE_APPLICATION.items():
+        assert application[field] == value
+
+def test_cache_hit(job, db):
+    statements = []
+    db.set_trace_callback(statements.append)
+    try:
+        first = get_job_application(job)
+        second = get_job_application(job)
+    finally:
+        db.set_trace_callback(None)
+    
+    # Only the first fetch reaches SQLite; the second is served from get_job_application's cache
+    assert first is second
+    assert len(statements) == 1
+
+def test_cache_not_stale_after_racing_update(job, monkeypatch):
+    db_cursor = main.db_cursor
+    
+    # The update lands after the read has fetched the old row but before the cache stores it
+    @contextmanager
+    def cursor_then_update():
+        with db_cursor() as cursor:
+            yield cursor
+        monkeypatch.setattr(main, "db_cursor", db_cursor)
+        update_job_application(job, status="Offer")
+    
+    monkeypatch.setattr(main, "db_cursor", cursor_then_update)
+    assert get_job_application(job)["status"] == "Applied"
+    assert get_job_application(job)["status"] == "Offer"
+
+def test_get_missing(db):
+    assert get_job_application(12345) is None
+
+@pytest.mark.parametrize("status", ["Interviewing", "Offer", "Rejected"])
+def test_update(job, status):
+    update_job_application(job, status=status)
+    
+    application = get_job_application(job)
+    assert application["status"] == status
+    # Fields that were not passed keep their values
+    assert application["company_name"] == SAMPLE_APPLICATION["company_name"]
+
+def test_load_job_sees_update_from_another_session(job):
+    _, application = main.load_job(job)
+    # Another tab or session edits the job after this session loaded it
+    update_job_application(job, job_description="Updated description")
+    
+    _, reloaded = main.load_job(job)
+    assert reloaded["job_description"] == "Updated description"
+    assert application["job_description"] == SAMPLE_APPLICATION["job_description"]
+
+def test_delete(job):
+    assert delete_job_application(job)
+    assert get_job_application(job) is None
+
+def test_bulk_add(db):
+    rows = [application_row(company_name=f"Company {i}") for i in range(50)]
+    
+    # One executemany in one transaction
+    assert add_job_applications_bulk(rows) == 50
+    assert len(list_job_applications_summary()) == 50
+
+def test_get_many(db):
+    # More IDs than fit in one query, plus one that doesn't exist
+    add_job_applications_bulk([application_row(company_name=f"Company {i}") for i in range(600)])
+    ids = [row[0] for row in list_job_applications_summary()]
+    
+    applications = get_job_applications(ids + [12345])
+    assert sorted(applications) == sorted(ids)
+    assert all(applications[job_id]["id"] == job_id for job_id in ids)
+
+# Rows for the stress test, built as tuples up front: one executemany inserts them all
+STRESS_ROW_COUNT = 10_000
+
+@pytest.mark.slow
+def test_bulk_add_stress(db):
+    rows = [application_row(company_name=f"Company {i}") for i in range(STRESS_ROW_COUNT)]
+    
+    assert add_job_applications_bulk(rows) == STRESS_ROW_COUNT
+    ids = [row[0] for row in list_job_applications_summary()]
+    assert len(get_job_applications(ids)) == STRESS_ROW_COUNT
+
+def test_transaction_rolls_back(job):
+    with pytest.raises(RuntimeError):
+        with db_transaction() as cursor:
+            cursor.execute("DELETE FROM job_applications WHERE id = ?", (job,))
+            raise RuntimeError("abort")
+    
+    assert get_job_application(job) is not None
+
+# Plan details (the last column of EXPLAIN QUERY PLAN) for a query
+def query_plan(db, sql, params=()):
+    return " ".join(row[-1] for row in db.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+def test_filter_by_status(db):
+    plan = query_plan(db, "SELECT id FROM job_applications WHERE status = ?", ("Applied",))
+    assert "USING COVERING INDEX idx_job_applications_status" in plan
+
+def test_list_uses_covering_index(db):
+    # Read straight from the index, already in date_applied order: no table lookups, no sort
+    plan = query_plan(db, main.SELECT_APPLICATION_SUMMARIES_SQL)
+    assert "USING COVERING INDEX idx_job_applications_list" in plan
+    assert "TEMP B-TREE" not in plan
+
+# Stands in for Ollama: answers the combined resume + cover letter prompt in its expected format
+def fake_ollama(request):
+    return httpx.Response(200, json={
+        "response": f"{main.SUGGESTIONS_MARKER}\n- Emphasize Python\n{main.COVER_LETTER_MARKER}\nDear Hiring Manager,\n\nI am applying."
+    })
+
+def test_generate_documents_for_job(job, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "http_client", httpx.AsyncClient(transport=httpx.MockTransport(fake_ollama)))
+    monkeypatch.setattr(main, "RESUME_FOLDER", str(tmp_path))
+    monkeypatch.setattr(main, "COVER_LETTER_FOLDER", str(tmp_path))
+    
+    base_resume = tmp_path / "base_resume.docx"
+    document = Document()
+    document.add_paragraph("Python developer")
+    document.save(base_resume)
+    
+    # Load the job, generate both documents and store their paths, the way the UI does:
+    # database work runs in worker threads while the event loop waits on the model
+    async def generate_and_store():
+        application = await main.run_blocking(get_job_application, job)
+        (resume_path, suggestions), (cover_letter_path, cover_letter_text) = await main.create_application_documents(
+            str(base_resume), application["job_description"], application["company_name"], application["position"]
+        )
+        await main.run_blocking(
+            lambda: update_job_application(job, resume_path=resume_path, cover_letter_path=cover_letter_path)
+        )
+        return suggestions, cover_letter_text
+    
+    suggestions, cover_letter_text = asyncio.run(generate_and_store())
+    
+    assert suggestions == "- Emphasize Python"
+    assert cover_letter_text.startswith("Dear Hiring Manager,")
+    application = get_job_application(job)
+    assert Document(application["resume_path"]).paragraphs[0].text == "Python developer"
+    assert any(p.text == "I am applying." for p in Document(application["cover_letter_path"]).paragraphs)
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
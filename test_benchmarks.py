@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import main
+from main import add_job_application, get_job_application, update_job_application, delete_job_application
+from test_app import SAMPLE_APPLICATION
+
+# Micro-benchmarks for the CRUD helpers against the in-memory test database.
+# Record a baseline with --benchmark-save=baseline, then check a change with --benchmark-compare
+def add_sample():
+    return add_job_application(date_applied="2024-01-01", **SAMPLE_APPLICATION)
+
+def test_add_bench(benchmark, db):
+    benchmark(add_sample)
+
+def test_get_bench(benchmark, db):
+    job_id = add_sample()
+    # __wrapped__ skips the lru_cache, so this times the query rather than a cache hit
+    assert benchmark(main._fetch_job_application.__wrapped__, job_id, 0) is not None
+
+def test_get_cached_bench(benchmark, db):
+    job_id = add_sample()
+    assert benchmark(get_job_application, job_id) is not None
+
+def test_update_bench(benchmark, db):
+    job_id = add_sample()
+    benchmark(update_job_application, job_id, status="Interviewing")
+
+def test_delete_bench(benchmark, db):
+    # Every round deletes a row inserted by its own (untimed) setup
+    benchmark.pedantic(delete_job_application, setup=lambda: ((add_sample(),), {}), rounds=100)
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
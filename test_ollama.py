@@ -1,23 +1,136 @@
-import requests
-
-def test_ollama_connection():
-    try:
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            json={
-                "model": "qwen2.5:14b",
-                "prompt": "Hello, are you working?",
-                "stream": False
-            }
-        )
-        response.raise_for_status()
-        result = response.json().get("response", "")
-        print("Ollama connection successful!")
-        print(f"Response: {result}")
-        return True
-    except Exception as e:
-        print(f"Error connecting to Ollama: {e}")
-        return False
-
-if __name__ == "__main__":
-    test_ollama_connection()
+import os
+import asyncio
+import httpx
+import orjson
+import pytest
+
+OLLAMA_API_URL = "http://localhost:11434/api/generate"
+# Lists the pulled models without running one: a cheap check that Ollama is up
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+# Models under test, e.g. OLLAMA_TEST_MODELS=qwen2.5:14b,llama3:8b; models that aren't pulled are skipped.
+# To keep them all loaded at once instead of swapping them in and out, start Ollama with
+# OLLAMA_MAX_LOADED_MODELS set to at least their number
+MODELS = os.getenv("OLLAMA_TEST_MODELS", "qwen2.5:14b").split(",")
+
+# Prompts checked one by one against the warmed-up model
+PROMPTS = [
+    "Hello, are you working?",
+    "Reply with the single word: ready",
+]
+
+# Prompts sent at once to each model; a semaphore per model keeps in flight
+# no more than Ollama serves in parallel for one model
+PROBE_COUNT = 8
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+# A reachable, answering model is all these tests check, so generation stops after one token
+PROBE_OPTIONS = {"num_predict": 1}
+
+# One event loop and one client for the whole module, so every probe and test reuses
+# the same kept-alive connections instead of opening new ones
+loop = asyncio.new_event_loop()
+client = httpx.AsyncClient(
+    timeout=httpx.Timeout(120.0, connect=5.0),
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+)
+
+def run(coroutine):
+    return loop.run_until_complete(coroutine)
+
+def teardown_module():
+    run(client.aclose())
+    loop.close()
+
+async def warm_up_model(model):
+    # An empty prompt only loads the model; keep_alive keeps it loaded for the following tests
+    response = await client.post(
+        OLLAMA_API_URL,
+        json={"model": model, "prompt": "", "keep_alive": "30m", "stream": False}
+    )
+    response.raise_for_status()
+
+async def warm_up_models(models):
+    await asyncio.gather(*(warm_up_model(model) for model in models))
+
+async def pulled_models():
+    response = await client.get(OLLAMA_TAGS_URL, timeout=2.0)
+    response.raise_for_status()
+    return {model["name"] for model in orjson.loads(response.content).get("models", [])}
+
+# Skip within a couple of seconds when Ollama is down or none of the models are pulled,
+# then load every pulled model once per test run, all at the same time, instead of
+# letting the first test for each pay for it. Returns the models that were loaded
+@pytest.fixture(scope="module", autouse=True)
+def warm_models():
+    try:
+        pulled = run(pulled_models())
+    except httpx.HTTPError as e:
+        pytest.skip(f"Ollama is not reachable: {e!r}")
+    models = [model for model in MODELS if model in pulled]
+    if not models:
+        pytest.skip(f"None of {MODELS} are pulled (ollama pull {MODELS[0]})")
+    
+    run(warm_up_models(models))
+    return models
+
+def require_model(model, warm_models):
+    if model not in warm_models:
+        pytest.skip(f"{model} is not pulled (ollama pull {model})")
+
+async def probe(semaphore, model, i):
+    async with semaphore:
+        response = await client.post(
+            OLLAMA_API_URL,
+            json={
+                "model": model,
+                "prompt": f"Hello, are you working? (probe {i})",
+                "stream": False,
+                "options": PROBE_OPTIONS
+            }
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content).get("response", "")
+
+# Every model is probed at the same time, so the test takes about as long as the slowest model
+async def probe_ollama(models):
+    semaphores = {model: asyncio.Semaphore(OLLAMA_NUM_PARALLEL) for model in models}
+    return await asyncio.gather(
+        *(probe(semaphores[model], model, i) for model in models for i in range(PROBE_COUNT)),
+        return_exceptions=True
+    )
+
+def test_ollama_connection(warm_models):
+    results = run(probe_ollama(warm_models))
+    errors = [result for result in results if isinstance(result, Exception)]
+    assert not errors, f"Error connecting to Ollama: {errors[0]!r}"
+    assert all(isinstance(result, str) for result in results)
+
+async def stream_generation(model, prompt):
+    # Reads the whole (one token) stream: its text and whether Ollama reported it done.
+    # The text can be empty on a healthy server, e.g. a leading whitespace or thinking token
+    text = []
+    async with client.stream(
+        "POST",
+        OLLAMA_API_URL,
+        json={"model": model, "prompt": prompt, "stream": True, "options": PROBE_OPTIONS}
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            chunk = orjson.loads(line)
+            text.append(chunk.get("response", ""))
+            if chunk.get("done"):
+                return "".join(text), True
+    return "".join(text), False
+
+@pytest.mark.parametrize("model", MODELS)
+@pytest.mark.parametrize("prompt", PROMPTS)
+def test_prompt(model, prompt, warm_models):
+    require_model(model, warm_models)
+    text, done = run(stream_generation(model, prompt))
+    assert done, f"Stream ended before Ollama reported done (got {text!r})"
+    assert isinstance(text, str)
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))